@@ -1,5 +1,6 @@
+import asyncio
 import logging
-import voluptuous as vol
+from functools import partial
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 from homeassistant.config_entries import ConfigEntry
@@ -28,6 +29,10 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# YAML configuration is no longer supported; setup happens through the config flow only.
+# This warns if a leftover music_companion: block is found instead of validating it again.
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 def get_master_config(hass: HomeAssistant):
     """Get the master configuration entry."""
     if DOMAIN not in hass.data:
@@ -100,8 +105,30 @@ async def setup_device_notification(hass: HomeAssistant, device_name: str, entry
         }
     )
 
+async def async_autostart_fetch_lyrics(hass: HomeAssistant, event) -> None:
+    """Start the fetch_lyrics service for every configured device once Home Assistant has started."""
+    # Devices may share a media player, which only needs to be started once
+    entity_ids = list(dict.fromkeys(hass.data.get(DOMAIN, {}).get("autostart_entities", {}).values()))
+    _LOGGER.debug("Autostarting fetch_lyrics service for entities: %s", entity_ids)
+
+    # Always autostart since there's no enable/disable switch anymore. The calls are
+    # blocking so that failures in the fetch_lyrics handler show up in the results.
+    results = await asyncio.gather(
+        *(
+            hass.services.async_call(DOMAIN, "fetch_lyrics", {"entity_id": entity_id}, blocking=True)
+            for entity_id in entity_ids
+        ),
+        return_exceptions=True,
+    )
+
+    for entity_id, result in zip(entity_ids, results):
+        if isinstance(result, Exception):
+            _LOGGER.error("Error in autostarting fetch_lyrics service for entity %s: %s", entity_id, result)
+        else:
+            _LOGGER.info("Autostarted fetch_lyrics service for entity: %s", entity_id)
+
 async def async_setup(hass: HomeAssistant, config) -> bool:
-    """Set up the Music Companion integration from yaml configuration."""
+    """Set up the Music Companion integration (config entries only)."""
     # No YAML configuration support anymore - only config flow
     return True
 
@@ -116,6 +143,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     
     # Store this entry's data using the entry ID as the key
     hass.data[DOMAIN][config_entry.entry_id] = config_entry.data
+    # Device list used by the tagging service is rebuilt on next use
+    hass.data[DOMAIN].pop("_device_configs", None)
     
     _LOGGER.warning("Stored config entry in hass.data[%s][%s]", DOMAIN, config_entry.entry_id)
     _LOGGER.warning("Current hass.data[%s] keys: %s", DOMAIN, list(hass.data[DOMAIN].keys()))
@@ -155,10 +184,9 @@ async def async_setup_master_entry(hass: HomeAssistant, config_entry: ConfigEntr
             }
             
             # Log spotify config (but mask secret)
-            safe_config = {**spotify_config}
-            if "client_secret" in safe_config:
-                safe_config["client_secret"] = "****"
-            _LOGGER.debug("Spotify configuration prepared: %s", safe_config)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                safe_config = {**spotify_config, "client_secret": "****"}
+                _LOGGER.debug("Spotify configuration prepared: %s", safe_config)
             
             # Create a config dictionary with the spotify section
             modified_config = {"spotify": spotify_config}
@@ -225,25 +253,14 @@ async def async_setup_device_entry(hass: HomeAssistant, config_entry: ConfigEntr
     _LOGGER.info("Device '%s' configured successfully (using event-based tagging)", device_name)
 
     # Autostart the fetch_lyrics service for this device
-    async def autostart(event):
-        _LOGGER.debug("Autostarting fetch_lyrics service for device: %s", device_name)
-        try:
-            entity_id = config_entry.data[CONF_MEDIA_PLAYER_ENTITY]
-            
-            # Always autostart since there's no enable/disable switch anymore
-            await hass.services.async_call(
-                DOMAIN,
-                "fetch_lyrics",
-                {"entity_id": entity_id}
-            )
-            _LOGGER.info("Autostarted fetch_lyrics service for entity: %s (device: %s)", entity_id, device_name)
-                
-        except Exception as e:
-            _LOGGER.error("Error in autostarting fetch_lyrics service for device %s: %s", device_name, e)
+    hass.data[DOMAIN].setdefault("autostart_entities", {})[config_entry.entry_id] = config_entry.data[CONF_MEDIA_PLAYER_ENTITY]
 
-    # Listen for Home Assistant start event
-    hass.bus.async_listen_once("homeassistant_start", autostart)
-    _LOGGER.debug("Registered autostart listener for device: %s", device_name)
+    # Listen for Home Assistant start event (one listener shared by all devices)
+    if not hass.data[DOMAIN].get("_autostart_registered"):
+        hass.bus.async_listen_once("homeassistant_start", partial(async_autostart_fetch_lyrics, hass))
+        hass.data[DOMAIN]["_autostart_registered"] = True
+        _LOGGER.debug("Registered autostart listener")
+    _LOGGER.debug("Queued autostart for device: %s", device_name)
 
     return True
 
@@ -253,28 +270,53 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     
     if entry_type == ENTRY_TYPE_MASTER:
         _LOGGER.info("Unloading Music Companion Master Configuration")
-        # Don't remove shared services as devices might still need them
+        # Don't remove shared services as devices might still need them, but stop
+        # the tagging services since they hold the ACRCloud settings from this entry
+        domain_data = hass.data.get(DOMAIN, {})
+        # Wait for running tagging calls to finish before their services and port
+        # locks are dropped; new calls are turned away as busy while the locks are held
+        tagging_locks = list(domain_data.get("_tagging_locks", {}).values())
+        for lock in tagging_locks:
+            await lock.acquire()
+        try:
+            for tagging_service in domain_data.pop("_tagging_services", {}).values():
+                tagging_service.stop()
+            domain_data.pop("_tagging_locks", None)
+        finally:
+            for lock in tagging_locks:
+                lock.release()
     else:
         device_name = config_entry.data.get(CONF_DEVICE_NAME, "Music Companion Device")
         _LOGGER.info("Unloading Music Companion device: %s", device_name)
         
-        # Stop any active lyrics sync for this device
-        from .const import DEVICE_DATA_LYRICS_SYNC
-        if (DOMAIN in hass.data and 
-            config_entry.entry_id in hass.data[DOMAIN] and
-            DEVICE_DATA_LYRICS_SYNC in hass.data[DOMAIN][config_entry.entry_id]):
+        # Stop any active lyrics sync and playback listeners for this device
+        from .const import DEVICE_DATA_LYRICS_SYNC, DEVICE_DATA_PLAYBACK_LISTENERS
+        runtime_data = hass.data.get(DOMAIN, {}).get(f"{config_entry.entry_id}_runtime")
+        if runtime_data:
+            for unsub in runtime_data.pop(DEVICE_DATA_PLAYBACK_LISTENERS, {}).values():
+                unsub()
             
-            lyrics_sync = hass.data[DOMAIN][config_entry.entry_id][DEVICE_DATA_LYRICS_SYNC]
+            lyrics_sync = runtime_data.get(DEVICE_DATA_LYRICS_SYNC)
             if lyrics_sync and lyrics_sync.active:
                 await lyrics_sync.stop()
                 _LOGGER.info("Stopped lyrics sync for device: %s", device_name)
         
+        # Stop the device's tagging service; it is recreated on the next tagging call
+        tagging_service = hass.data.get(DOMAIN, {}).get("_tagging_services", {}).pop(config_entry.entry_id, None)
+        if tagging_service:
+            tagging_service.stop()
+        
+        # Don't autostart lyrics for a device that no longer exists
+        if DOMAIN in hass.data and "autostart_entities" in hass.data[DOMAIN]:
+            hass.data[DOMAIN]["autostart_entities"].pop(config_entry.entry_id, None)
+        
         # Unload the text platform
         await hass.config_entries.async_forward_entry_unload(config_entry, "text")
     
     # Remove this entry's data
     if DOMAIN in hass.data and config_entry.entry_id in hass.data[DOMAIN]:
         del hass.data[DOMAIN][config_entry.entry_id]
+        hass.data[DOMAIN].pop("_device_configs", None)
     
     return True
 
@@ -45,6 +45,7 @@ DEFAULT_SPOTIFY_PLAYLIST_NAME = "Home Assistant Music Discoveries"
 DEVICE_DATA_LYRICS_SYNC = "lyrics_sync"
 DEVICE_DATA_LAST_MEDIA_CONTENT_ID = "last_media_content_id"
 DEVICE_DATA_LYRICS_ENTITIES = "lyrics_entities"
+DEVICE_DATA_PLAYBACK_LISTENERS = "playback_listeners"
 
 # Device capability constants
 CAPABILITY_LYRICS_DISPLAY = "lyrics_display"
@@ -1,10 +1,13 @@
+from array import array
+import bisect
+from collections import OrderedDict
 import logging
 import datetime
+import functools
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
-import lrc_kit
 import time
 import re
 import asyncio
@@ -14,6 +17,7 @@ from .const import (
     DEVICE_DATA_LYRICS_SYNC, 
     DEVICE_DATA_LAST_MEDIA_CONTENT_ID,
     DEVICE_DATA_LYRICS_ENTITIES,
+    DEVICE_DATA_PLAYBACK_LISTENERS,
     DEVICE_LYRICS_LINE1_TEMPLATE,
     DEVICE_LYRICS_LINE2_TEMPLATE,
     DEVICE_LYRICS_LINE3_TEMPLATE,
@@ -21,8 +25,10 @@ from .const import (
     CONF_USE_DISPLAY_DEVICE,
     VIEW_ASSIST_DOMAIN
 )
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.event import async_track_state_change_event
 from .media_tracker import MediaTracker
+from .lyrics_provider import QQLyricsProvider
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +36,57 @@ SERVICE_FETCH_LYRICS_SCHEMA = vol.Schema({
     vol.Required("entity_id"): cv.entity_id
 })
 
+# media_content_id prefix of radio stations, which have no lyrics to fetch
+_RADIO_PREFIX = "library://radio"
+
+# Precompiled patterns used by lyricSplit and clean_track_name
+_TIMESTAMP_RE = re.compile(r'\[.+?\]')
+_BRACKET_RE = re.compile(r'\s*[\(\[\{\<].*?[\)\]\}\>]')
+# Four-digit years and short '99 style years, removed in a single pass
+_YEAR_RE = re.compile(r'\b\d{4}\b|\b\'\d{2}\b')
+# Only split on dashes surrounded by spaces or dashes followed by specific version-related words
+_DASH_RE = re.compile(r'\s+-\s+|\s*-\s*(?:remaster|version|edit|mix|single|live|from)\b', re.IGNORECASE)
+# Common phrases fused into one alternation so the name is only scanned once
+_COMMON_PHRASE_RE = re.compile(
+    "|".join(
+        f"(?:{phrase})"
+        for phrase in (
+            r'\b(?:from|on)\s+(?:the\s+)?(?:"[^"]*"|\'[^\']*\'|\S+)?\s*(?:soundtrack|album|movie|film|series|show)\b',
+            r'\b(?:original|movie|film|radio|single|album|instrumental|acoustic|live|studio|extended|shortened)\s+(?:version|edit|mix|cut|recording)\b',
+            r'\b(?:remaster(?:ed)?|remix(?:ed)?|feat\.?|ft\.?|featuring)\b',
+            r'\b(?:bonus\s+track|deluxe\s+edition|digital\s+exclusive)\b',
+            r'\b(?:explicit|clean)\s+(?:version|edit)?\b',
+            r'\d+(?:th|st|nd|rd)?\s+(?:anniversary|edition)\b',
+            r'\b(?:anthology|world\s+wildlife\s+fund)\s+(?:version)?\b',
+        )
+    ),
+    re.IGNORECASE,
+)
+_NON_LATIN_RE = re.compile(r'[^\x00-\x7F\xC0-\xFF\u2000-\u206F]')
+_MULTISPACE_RE = re.compile(r'\s+')
+_TRAIL_PUNCT_RE = re.compile(r'[.,;:!?]+$')
+_WORD_RE = re.compile(r'\b[A-Za-z]+\b')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+# Curly quotes and stray accents mapped to plain ASCII quotes
+_QUOTE_TABLE = str.maketrans({
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u00b4": "'",
+    "`": "'",
+})
+
+# Recent lyrics lookups keyed by lowercased (artist, track), most recently used last.
+# Values are (timeline, lyrics, expiry in time.monotonic() seconds); songs without
+# lyrics are cached too, but for a shorter time in case the provider catches up.
+_LYRICS_CACHE_SIZE = 128
+_LYRICS_CACHE_TTL = 6 * 60 * 60
+_LYRICS_CACHE_NEGATIVE_TTL = 10 * 60
+_LYRICS_CACHE = OrderedDict()
+# Lookups currently waiting on the lyrics provider, keyed like _LYRICS_CACHE
+_INFLIGHT_LOOKUPS = {}
+
 
 def get_device_data(hass: HomeAssistant, entry_id: str = None):
     """Get or create device-specific data structure."""
@@ -52,7 +109,8 @@ def get_device_data(hass: HomeAssistant, entry_id: str = None):
     if DEVICE_DATA_LYRICS_SYNC not in device_data:
         device_data[DEVICE_DATA_LYRICS_SYNC] = None
     if DEVICE_DATA_LAST_MEDIA_CONTENT_ID not in device_data:
-        device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID] = None
+        # Last processed media_content_id per media player entity
+        device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID] = {}
     
     return device_data
 
@@ -95,6 +153,7 @@ class LyricsSynchronizer:
     
     def __init__(self, hass: HomeAssistant, entry_id: str = None):
         self.hass = hass
+        self._loop = hass.loop
         self.entry_id = entry_id
         self.media_tracker = None
         self.entity_id = None
@@ -111,9 +170,27 @@ class LyricsSynchronizer:
         # Control flags
         self.active = False
         
-        # Display update handling
-        self.last_update_time = 0
-        self.force_update_interval = 3  # Force display update every 3 seconds even without position change
+        # Scheduled advance to the next lyric line. Only the next boundary is ever
+        # scheduled, relative to the loop time at which the song position was zero.
+        self._anchor_time = None
+        self._line_handle = None
+        
+        # Loop time of the last periodic position debug log
+        self._last_log_time = 0
+        
+        # Pending debounced resync after a seek
+        self._seek_handle = None
+        self.seek_debounce = 0.15  # seconds
+        
+        # The scheduled advance is anchored on the tracker's rounded position, so it
+        # can fire a few ms before the tracker itself passes the line's timestamp
+        self.early_advance_tolerance = 50  # ms
+        
+        # Set while lyrics for a new track are looked up: the media tracker keeps
+        # running but nothing is displayed until async_retarget() or stop()
+        self.suspended = False
+        self._suspend_timeout_handle = None
+        self.suspend_timeout = 30  # seconds before a suspended session is stopped
     
     async def start(self, entity_id: str, timeline: list, lyrics: list, pos=None, updated_at=None, is_radio_source=False):
         """Start lyrics synchronization for the given entity."""
@@ -121,10 +198,10 @@ class LyricsSynchronizer:
             await self.stop()
             
         self.entity_id = entity_id
-        self.timeline = timeline
+        # Keep the timestamps in a compact C int array; bisect works on it directly
+        self.timeline = array("i", timeline)
         self.lyrics = lyrics
         self.current_line_index = -1
-        self.last_update_time = datetime.datetime.now().timestamp()
         
         # Store the current track info from the player state
         player_state = self.hass.states.get(entity_id)
@@ -145,7 +222,8 @@ class LyricsSynchronizer:
             self.update_lyrics_display,  # Position update callback
             self.handle_track_change,    # Track change callback
             is_radio_source,             # Flag for radio source
-            self.entry_id                # Device entry ID
+            self.entry_id,               # Device entry ID
+            self._handle_playback_state  # Pause/resume callback
         )
         
         # Set the initial position if provided
@@ -153,80 +231,148 @@ class LyricsSynchronizer:
             # Use the set_initial_position method which works for all source types
             self.media_tracker.set_initial_position(pos, updated_at)
             
-            # Calculate initial position in milliseconds for better lyrics placement
-            initial_position_ms = pos * 1000
-            _LOGGER.info("LyricsSynchronizer: Initial position is %.2f ms (device: %s)", 
-                        initial_position_ms, self.entry_id)
-            
-            # Find the correct starting point in lyrics
-            line_found = False
-            if timeline:
-                # For radio sources, we need to be more aggressive in finding the right starting point
-                if is_radio_source:
-                    # Calculate where we expect to be in about 500ms (to account for processing delay)
-                    target_position_ms = initial_position_ms + 500
-                    
-                    # Try to find a line that's AFTER our current position but within a reasonable window
-                    for i in range(1, len(timeline)):
-                        if timeline[i-1] > initial_position_ms and timeline[i-1] < initial_position_ms + 10000:
-                            # Found a line coming up soon - use it
-                            self.current_line_index = i-1
-                            _LOGGER.info("LyricsSynchronizer: Starting at upcoming line index %d at %d ms (device: %s)", 
-                                       i-1, timeline[i-1], self.entry_id)
-                            line_found = True
-                            
-                            # Display immediately
-                            previous_line = lyrics[i-2] if i > 1 else ""
-                            current_line = lyrics[i-1]
-                            next_line = lyrics[i] if i < len(lyrics) else ""
-                            
-                            await update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
-                            break
-                
-                # If we didn't find an upcoming line, or this isn't a radio source,
-                # fall back to finding the line that matches our current position
-                if not line_found:
-                    for i in range(1, len(timeline)):
-                        if timeline[i-1] <= initial_position_ms < timeline[i]:
-                            # We found the right line to start with
-                            self.current_line_index = i-1
-                            _LOGGER.info("LyricsSynchronizer: Starting at line index %d (device: %s)", 
-                                        self.current_line_index, self.entry_id)
-                            
-                            # Display the initial lyrics
-                            previous_line = lyrics[i-2] if i > 1 else ""
-                            current_line = lyrics[i-1]
-                            next_line = lyrics[i] if i < len(lyrics) else ""
-                            
-                            await update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
-                            break
-            
-            # If we couldn't find the right position in the timeline, 
-            # at least display the first line if we have lyrics
-            if self.current_line_index == -1 and len(lyrics) > 0:
-                # Show first few lines immediately
-                _LOGGER.info("LyricsSynchronizer: No matching position found, showing first lines (device: %s)", self.entry_id)
-                if len(lyrics) > 1:
-                    await update_lyrics_display(self.hass, "", lyrics[0], lyrics[1], self.entry_id)
-                else:
-                    await update_lyrics_display(self.hass, "", lyrics[0], "", self.entry_id)
+            await self._show_initial_lines(pos * 1000, is_radio_source)
         
         # Start tracking
         await self.media_tracker.start_tracking()
         self.active = True
         
-        # Start a periodic force update task
-        asyncio.create_task(self._force_update_task())
+        # Schedule the next line change from the tracker's current position
+        self._schedule_from_position(self.media_tracker.calculate_current_position())
         
         _LOGGER.info("LyricsSynchronizer: Started for %s with %d lyrics lines (radio source: %s, device: %s)", 
                     self.entity_id, len(self.lyrics), is_radio_source, self.entry_id)
     
+    async def _show_initial_lines(self, initial_position_ms: float, is_radio_source: bool):
+        """Display the lyric lines for the starting position of a new session."""
+        _LOGGER.info("LyricsSynchronizer: Initial position is %.2f ms (device: %s)", 
+                    initial_position_ms, self.entry_id)
+        
+        # Find the correct starting point in lyrics
+        line_found = False
+        if self.timeline:
+            # For radio sources, we need to be more aggressive in finding the right starting point
+            if is_radio_source:
+                # Calculate where we expect to be in about 500ms (to account for processing delay)
+                target_position_ms = initial_position_ms + 500
+            
+                # Try to find a line that's AFTER our current position but within a reasonable window
+                upcoming_index = bisect.bisect_right(self.timeline, initial_position_ms)
+                if upcoming_index < len(self.timeline) - 1 and self.timeline[upcoming_index] < initial_position_ms + 10000:
+                    # Found a line coming up soon - use it
+                    self.current_line_index = upcoming_index
+                    _LOGGER.info("LyricsSynchronizer: Starting at upcoming line index %d at %d ms (device: %s)", 
+                               upcoming_index, self.timeline[upcoming_index], self.entry_id)
+                    line_found = True
+                
+                    # Display immediately
+                    previous_line, current_line, next_line = self._get_display_lines(upcoming_index)
+                    await update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
+        
+            # If we didn't find an upcoming line, or this isn't a radio source,
+            # fall back to finding the line that matches our current position
+            if not line_found:
+                line_index = self._find_line_index(initial_position_ms)
+                if 0 <= line_index < len(self.timeline) - 1:
+                    # We found the right line to start with
+                    self.current_line_index = line_index
+                    _LOGGER.info("LyricsSynchronizer: Starting at line index %d (device: %s)", 
+                                self.current_line_index, self.entry_id)
+                
+                    # Display the initial lyrics
+                    previous_line, current_line, next_line = self._get_display_lines(line_index)
+                    await update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
+    
+        # If we couldn't find the right position in the timeline, 
+        # at least display the first line if we have lyrics
+        if self.current_line_index == -1 and len(self.lyrics) > 0:
+            # Show first few lines immediately
+            _LOGGER.info("LyricsSynchronizer: No matching position found, showing first lines (device: %s)", self.entry_id)
+            if len(self.lyrics) > 1:
+                await update_lyrics_display(self.hass, "", self.lyrics[0], self.lyrics[1], self.entry_id)
+            else:
+                await update_lyrics_display(self.hass, "", self.lyrics[0], "", self.entry_id)
+    
+    async def suspend(self, clear_display: bool = True):
+        """Blank the display while lyrics for a new track are looked up, keeping the media tracker running."""
+        if not self.active:
+            return
+        
+        self.suspended = True
+        self.current_line_index = -1
+        self._cancel_line_handle()
+        if self._seek_handle:
+            self._seek_handle.cancel()
+            self._seek_handle = None
+        
+        # Don't keep a tracker running forever if no new lyrics arrive
+        if self._suspend_timeout_handle:
+            self._suspend_timeout_handle.cancel()
+        self._suspend_timeout_handle = self._loop.call_later(self.suspend_timeout, self._suspend_expired)
+        
+        if clear_display:
+            await update_lyrics_display(self.hass, "", "", "", self.entry_id)
+        _LOGGER.debug("LyricsSynchronizer: Suspended (device: %s)", self.entry_id)
+    
+    @callback
+    def _suspend_expired(self):
+        """Stop a session that stayed suspended without being retargeted."""
+        self._suspend_timeout_handle = None
+        if self.active and self.suspended:
+            _LOGGER.info("LyricsSynchronizer: No new lyrics while suspended, stopping (device: %s)", self.entry_id)
+            self.hass.async_create_task(self.stop(), eager_start=True)
+    
+    def can_retarget(self, entity_id: str) -> bool:
+        """Return True if this session is running for the entity and can switch lyrics in place."""
+        return self.active and self.media_tracker is not None and self.entity_id == entity_id
+    
+    async def async_retarget(self, timeline: list, lyrics: list, pos=None, updated_at=None, is_radio_source=False):
+        """Switch to the lyrics of a new track without restarting the media tracker."""
+        if self._suspend_timeout_handle:
+            self._suspend_timeout_handle.cancel()
+            self._suspend_timeout_handle = None
+        self._cancel_line_handle()
+        if self._seek_handle:
+            self._seek_handle.cancel()
+            self._seek_handle = None
+        
+        self.timeline = array("i", timeline)
+        self.lyrics = lyrics
+        self.current_line_index = -1
+        
+        player_state = self.hass.states.get(self.entity_id)
+        if player_state:
+            self.current_track = player_state.attributes.get("media_title", "")
+            self.current_artist = player_state.attributes.get("media_artist", "")
+        
+        # The tracker already follows the player's state through its listener; only
+        # the position is re-seeded (reading the state again would replace the seed
+        # with the player's older media_position)
+        self.media_tracker.is_radio_source = is_radio_source
+        if pos is not None and updated_at is not None:
+            self.media_tracker.set_initial_position(pos, updated_at)
+            await self._show_initial_lines(pos * 1000, is_radio_source)
+        
+        self.suspended = False
+        self._schedule_from_position(self.media_tracker.calculate_current_position())
+        
+        _LOGGER.info("LyricsSynchronizer: Retargeted %s to '%s' with %d lyrics lines (radio source: %s, device: %s)", 
+                    self.entity_id, self.current_track, len(self.lyrics), is_radio_source, self.entry_id)
+    
     async def stop(self):
         """Stop lyrics synchronization."""
         if not self.active:
             return
             
         self.active = False
+        self.suspended = False
+        self._cancel_line_handle()
+        if self._seek_handle:
+            self._seek_handle.cancel()
+            self._seek_handle = None
+        if self._suspend_timeout_handle:
+            self._suspend_timeout_handle.cancel()
+            self._suspend_timeout_handle = None
         
         if self.media_tracker:
             await self.media_tracker.stop_tracking()
@@ -237,196 +383,219 @@ class LyricsSynchronizer:
         
         _LOGGER.info("LyricsSynchronizer: Stopped (device: %s)", self.entry_id)
     
-    def update_lyrics_display(self, media_timecode: float):
+    def _find_line_index(self, position_ms: float) -> int:
+        """Return the index of the last lyric line starting at or before position_ms (-1 if before the first line)."""
+        return bisect.bisect_right(self.timeline, position_ms) - 1
+    
+    def _get_display_lines(self, index: int):
+        """Return the previous, current and next lyric lines around the given index."""
+        previous_line = self.lyrics[index-1] if index > 0 else ""
+        current_line = self.lyrics[index]
+        next_line = self.lyrics[index+1] if index+1 < len(self.lyrics) else ""
+        return previous_line, current_line, next_line
+    
+    def _cancel_line_handle(self):
+        """Cancel the pending scheduled line advance, if any."""
+        if self._line_handle:
+            self._line_handle.cancel()
+            self._line_handle = None
+    
+    def _schedule_from_position(self, position: float):
+        """Re-anchor the timeline to the given position (seconds) and schedule the next line."""
+        self._cancel_line_handle()
+        self._anchor_time = self._loop.time() - position
+        self._schedule_line(bisect.bisect_right(self.timeline, position * 1000))
+    
+    def _schedule_line(self, index: int):
+        """Schedule the display to advance to the given line when its timestamp is reached."""
+        if not self.active or index >= len(self.timeline):
+            return
+        self._line_handle = self._loop.call_at(
+            self._anchor_time + self.timeline[index] / 1000, self._advance_to, index
+        )
+    
+    @callback
+    def _advance_to(self, index: int):
+        """Show the scheduled lyric line and schedule the one after it."""
+        self._line_handle = None
+        # While paused nothing is rescheduled; _handle_playback_state re-anchors on resume
+        if not self.active or self.suspended or not self.media_tracker or self.media_tracker.state != "playing":
+            return
+        
+        # The last timeline entry marks the end of the lyrics
+        if index == len(self.timeline) - 1:
+            _LOGGER.info("LyricsSynchronizer: Lyrics finished (device: %s)", self.entry_id)
+            self.hass.async_create_task(self.stop(), eager_start=True)
+            return
+        
+        if index != self.current_line_index:
+            self.current_line_index = index
+            previous_line, current_line, next_line = self._get_display_lines(index)
+            self.hass.async_create_task(
+                update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id),
+                eager_start=True,
+            )
+            _LOGGER.debug("LyricsSynchronizer: Advanced to line %d on schedule (device: %s)", 
+                        index, self.entry_id)
+        
+        self._schedule_line(index + 1)
+    
+    async def update_lyrics_display(self, media_timecode: float):
         """Update lyrics display based on current media position."""
+        if self.suspended:
+            return
         if not self.active or not self.timeline or not self.lyrics:
             _LOGGER.warning("LyricsSynchronizer: Unable to update lyrics - no active timeline or lyrics (device: %s)", self.entry_id)
             return
             
-        # Record update time for force update mechanism
-        self.last_update_time = datetime.datetime.now().timestamp()
-            
         # Convert to milliseconds for comparison with timeline
         position_ms = media_timecode * 1000
         
-        # Log position occasionally for debugging
-        if int(media_timecode) % 5 == 0 and abs(media_timecode - int(media_timecode)) < 0.15:  # Log roughly every 5 seconds
+        # Log position every 5 seconds for debugging
+        now = self._loop.time()
+        if now - self._last_log_time >= 5.0 and _LOGGER.isEnabledFor(logging.DEBUG):
+            self._last_log_time = now
             _LOGGER.debug("LyricsSynchronizer: Current position: %.2f seconds (%.2f ms, device: %s)", 
                         media_timecode, position_ms, self.entry_id)
         
         # Check if lyrics finished
         if position_ms >= self.timeline[-1]:
             _LOGGER.info("LyricsSynchronizer: Lyrics finished (device: %s)", self.entry_id)
-            asyncio.create_task(self.stop())
+            # Called from the MediaTracker position loop, which stop() cancels, so it can't be awaited here
+            self.hass.async_create_task(self.stop(), eager_start=True)
             return
             
-        # Find current line
-        found_position = False
-        for i in range(1, len(self.timeline)):
-            if self.timeline[i-1] <= position_ms < self.timeline[i]:
-                if i-1 != self.current_line_index:
-                    self.current_line_index = i-1
-                    
-                    # Get lines to display
-                    previous_line = self.lyrics[i-2] if i > 1 else ""
-                    current_line = self.lyrics[i-1]
-                    next_line = self.lyrics[i] if i < len(self.lyrics) else ""
-                    
-                    # Update display
-                    asyncio.create_task(
-                        update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
-                    )
-                    
-                    _LOGGER.debug("LyricsSynchronizer: Updated to line %d at %f ms (device: %s)", 
-                                i-1, position_ms, self.entry_id)
+        # Find current line (the end of the lyrics was handled above)
+        line_index = self._find_line_index(position_ms)
+        
+        # A tick just before the boundary of a line the schedule already advanced to
+        # is rounding, not a seek; going back would redisplay the previous line
+        if (self.current_line_index >= 0 and line_index == self.current_line_index - 1
+                and self.timeline[self.current_line_index] - position_ms < self.early_advance_tolerance):
+            return
+        
+        # Re-anchor the scheduled line advance whenever the tracker moves us to a
+        # new line or nothing is pending (e.g. after resuming from pause)
+        if line_index != self.current_line_index or self._line_handle is None:
+            self._schedule_from_position(media_timecode)
+        
+        if line_index >= 0:
+            if line_index != self.current_line_index:
+                self.current_line_index = line_index
                 
-                found_position = True
-                break
+                # Get lines to display
+                previous_line, current_line, next_line = self._get_display_lines(line_index)
+                
+                # Update display
+                await update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
+                
+                _LOGGER.debug("LyricsSynchronizer: Updated to line %d at %f ms (device: %s)", 
+                            line_index, position_ms, self.entry_id)
         
         # If position wasn't found in any interval but lyrics exist,
-        # it might be before the first line
-        if not found_position and position_ms < self.timeline[0]:
+        # it must be before the first line
+        else:
             if self.current_line_index != -1:
                 self.current_line_index = -1
-                asyncio.create_task(
-                    update_lyrics_display(self.hass, "", "Waiting for first line...", self.lyrics[0], self.entry_id)
-                )
+                await update_lyrics_display(self.hass, "", "Waiting for first line...", self.lyrics[0], self.entry_id)
     
-    def handle_track_change(self, is_track_change=True):
+    async def handle_track_change(self, is_track_change=True):
         """Handle track changes or seek operations detected by the media tracker.
         
         Args:
             is_track_change: True if actual track changed, False if just a seek operation
         """
         if is_track_change:
-            # For actual track changes, stop lyrics entirely
-            _LOGGER.info("LyricsSynchronizer: Track change detected, stopping lyrics (device: %s)", self.entry_id)
-            asyncio.create_task(self.stop())
+            if self._refetch_expected():
+                # The playback monitor will fetch lyrics for the new track, so keep
+                # tracking the player and the display until they are swapped in
+                _LOGGER.info("LyricsSynchronizer: Track change detected, suspending lyrics (device: %s)", self.entry_id)
+                await self.suspend(clear_display=False)
+            else:
+                # Nothing will retarget this session (e.g. lyrics started by audio
+                # tagging, or radio), so stop lyrics entirely
+                _LOGGER.info("LyricsSynchronizer: Track change detected, stopping lyrics (device: %s)", self.entry_id)
+                await self.stop()
         else:
-            # For seek operations, just reset the current line index to force resyncing
-            _LOGGER.info("LyricsSynchronizer: Seek operation detected, resyncing lyrics (device: %s)", self.entry_id)
+            # For seek operations, resync once the seeking settles. Scrubbing fires
+            # many seeks in a row, so only the last one within the debounce window
+            # triggers a resync.
+            _LOGGER.debug("LyricsSynchronizer: Seek operation detected, scheduling resync (device: %s)", self.entry_id)
+            if self._seek_handle:
+                self._seek_handle.cancel()
+            self._seek_handle = self._loop.call_later(self.seek_debounce, self._do_seek_resync)
+    
+    @callback
+    def _handle_playback_state(self, is_playing: bool):
+        """Drop the scheduled line advance on pause and re-anchor it on resume."""
+        if not is_playing:
+            # The pending advance was timed against the pre-pause anchor
+            self._cancel_line_handle()
+        elif self.active and not self.suspended and self.media_tracker:
+            self._schedule_from_position(self.media_tracker.calculate_current_position())
+    
+    def _refetch_expected(self) -> bool:
+        """Return True if the playback monitor will fetch lyrics for the player's new track."""
+        tracker = self.media_tracker
+        if not tracker or tracker.is_radio_source or tracker.state != "playing":
+            return False
+        media_content_id = tracker.media_content_id
+        if not media_content_id or media_content_id.startswith(_RADIO_PREFIX):
+            return False
+        device_data = get_device_data(self.hass, self.entry_id)
+        return (self.entity_id in device_data.get(DEVICE_DATA_PLAYBACK_LISTENERS, {})
+                and device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID].get(self.entity_id) != media_content_id)
+    
+    @callback
+    def _do_seek_resync(self):
+        """Run the debounced resync after the last seek."""
+        self._seek_handle = None
+        if self.active and not self.suspended:
+            self.hass.async_create_task(self._resync_after_seek(), eager_start=True)
+    
+    async def _resync_after_seek(self):
+        """Resync the lyrics display to the current position after a seek."""
+        _LOGGER.info("LyricsSynchronizer: Seek operation detected, resyncing lyrics (device: %s)", self.entry_id)
+        
+        # Get current position to find the right lyrics line
+        if self.media_tracker and self.media_tracker.media_position is not None:
+            current_position = self.media_tracker.calculate_current_position()
+            position_ms = current_position * 1000
+            
+            # Look for the right lyrics line
+            line_index = self._find_line_index(position_ms)
+            
+            # A small seek within the current line leaves the display as it is
+            if 0 <= line_index < len(self.timeline) - 1 and line_index == self.current_line_index:
+                _LOGGER.debug("LyricsSynchronizer: Seek stayed on line %d, display unchanged (device: %s)", 
+                            line_index, self.entry_id)
+                self._schedule_from_position(current_position)
+                return
             
-            # Get current position to find the right lyrics line
-            if self.media_tracker and self.media_tracker.media_position is not None:
-                current_position = self.media_tracker.calculate_current_position()
-                position_ms = current_position * 1000
+            # Find the appropriate lyrics line for current position
+            self.current_line_index = -1  # Reset first
+            
+            if 0 <= line_index < len(self.timeline) - 1:
+                # Found the right line
+                self.current_line_index = line_index
                 
-                # Find the appropriate lyrics line for current position
-                self.current_line_index = -1  # Reset first
+                # Display corresponding lyrics
+                previous_line, current_line, next_line = self._get_display_lines(line_index)
                 
-                # Look for the right lyrics line
-                for i in range(1, len(self.timeline)):
-                    if self.timeline[i-1] <= position_ms < self.timeline[i]:
-                        # Found the right line
-                        self.current_line_index = i-1
-                        
-                        # Display corresponding lyrics
-                        previous_line = self.lyrics[i-2] if i > 1 else ""
-                        current_line = self.lyrics[i-1]
-                        next_line = self.lyrics[i] if i < len(self.lyrics) else ""
-                        
-                        asyncio.create_task(
-                            update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
-                        )
-                        
-                        _LOGGER.info("LyricsSynchronizer: Resynced to line %d at %f ms (device: %s)", 
-                                   i-1, position_ms, self.entry_id)
-                        break
+                await update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
                 
-                # If we couldn't find a matching line, check if we're before the first line
-                if self.current_line_index == -1:
-                    if position_ms < self.timeline[0]:
-                        asyncio.create_task(
-                            update_lyrics_display(self.hass, "", "Waiting for first line...", self.lyrics[0], self.entry_id)
-                        )
-                    else:
-                        # We might be past the end
-                        asyncio.create_task(
-                            update_lyrics_display(self.hass, "", "Lyrics finished", "", self.entry_id)
-                        )
-    
-    async def _force_update_task(self):
-        """Periodically force update the lyrics display to ensure it doesn't get stuck."""
-        try:
-            # Use a shorter interval for the first few updates to ensure quick initial sync
-            initial_updates = 0
-            max_initial_updates = 5
-            initial_interval = 0.5  # Faster initial updates
+                _LOGGER.info("LyricsSynchronizer: Resynced to line %d at %f ms (device: %s)", 
+                           line_index, position_ms, self.entry_id)
             
-            while self.active:
-                # Use shorter interval for initial updates
-                if initial_updates < max_initial_updates:
-                    await asyncio.sleep(initial_interval)
-                    initial_updates += 1
+            # If we couldn't find a matching line, check if we're before the first line
+            if self.current_line_index == -1:
+                if position_ms < self.timeline[0]:
+                    await update_lyrics_display(self.hass, "", "Waiting for first line...", self.lyrics[0], self.entry_id)
                 else:
-                    await asyncio.sleep(self.force_update_interval)
-                
-                # If we're active but no update in a while, force one
-                current_time = datetime.datetime.now().timestamp()
-                time_since_update = current_time - self.last_update_time
-                
-                if time_since_update > (0.5 if initial_updates < max_initial_updates else self.force_update_interval):
-                    _LOGGER.debug("LyricsSynchronizer: Forcing display update (%.1f seconds since last update, device: %s)", 
-                                 time_since_update, self.entry_id)
-                    
-                    # Recalculate current position
-                    if self.media_tracker and self.media_tracker.state == "playing":
-                        current_position = self.media_tracker.calculate_current_position()
-                        position_ms = current_position * 1000
-                        
-                        if len(self.timeline) > 1 and len(self.lyrics) > 1:
-                            # Find appropriate line for current position
-                            found_line = False
-                            for i in range(1, len(self.timeline)):
-                                if self.timeline[i-1] <= position_ms < self.timeline[i]:
-                                    # Get lines to display
-                                    previous_line = self.lyrics[i-2] if i > 1 else ""
-                                    current_line = self.lyrics[i-1]
-                                    next_line = self.lyrics[i] if i < len(self.lyrics) else ""
-                                    
-                                    # Force update the display
-                                    await update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
-                                    self.last_update_time = current_time
-                                    _LOGGER.debug("LyricsSynchronizer: Force updated to line %d (%.1f ms, device: %s)", 
-                                                i-1, position_ms, self.entry_id)
-                                    found_line = True
-                                    break
-                            
-                            # If no matching line found, check if we're past the end
-                            if not found_line:
-                                if position_ms < self.timeline[0]:
-                                    # Before first line
-                                    await update_lyrics_display(self.hass, "", 
-                                                              "Coming up...", self.lyrics[0], self.entry_id)
-                                elif position_ms >= self.timeline[-1]:
-                                    # Past the last line
-                                    await update_lyrics_display(self.hass, 
-                                                              self.lyrics[-1], "End of lyrics", "", self.entry_id)
-                                else:
-                                    # We should have found a line - try to recover
-                                    # Find the closest line
-                                    closest_idx = min(range(len(self.timeline)), 
-                                                    key=lambda i: abs(self.timeline[i] - position_ms))
-                                    
-                                    _LOGGER.info("LyricsSynchronizer: Couldn't find exact line match, using closest: %d (device: %s)", 
-                                               closest_idx, self.entry_id)
-                                    
-                                    previous_line = self.lyrics[closest_idx-1] if closest_idx > 0 else ""
-                                    current_line = self.lyrics[closest_idx]
-                                    next_line = self.lyrics[closest_idx+1] if closest_idx < len(self.lyrics)-1 else ""
-                                    
-                                    await update_lyrics_display(self.hass, previous_line, current_line, next_line, self.entry_id)
-                                
-                                self.last_update_time = current_time
-                        else:
-                            # If we have lyrics but no timeline yet, or in initialization
-                            if len(self.lyrics) > 0:
-                                await update_lyrics_display(self.hass, "", "Loading lyrics...", self.lyrics[0], self.entry_id)
-                                self.last_update_time = current_time
-        except asyncio.CancelledError:
-            _LOGGER.debug("LyricsSynchronizer: Force update task cancelled (device: %s)", self.entry_id)
-        except Exception as e:
-            _LOGGER.error("LyricsSynchronizer: Error in force update task (device: %s): %s", self.entry_id, str(e))
+                    # We might be past the end
+                    await update_lyrics_display(self.hass, "", "Lyrics finished", "", self.entry_id)
+            
+            self._schedule_from_position(current_position)
 
 
 def lyricSplit(lyrics):
@@ -437,15 +606,14 @@ def lyricSplit(lyrics):
     for line in lyrics.splitlines():
         if line.startswith(("[0", "[1", "[2", "[3")):
             # Match timestamp in square brackets (e.g., [01:15.35])
-            regex = re.compile(r'\[.+?\]')
-            match = re.match(regex, line)
+            match = _TIMESTAMP_RE.match(line)
 
             if not match:
                 continue  # Skip lines with no timestamp
 
             # Extract and clean the timestamp
             _time = match.group(0)[1:-1]  # Remove square brackets
-            line = regex.sub('', line).strip()  # Remove timestamp from the line
+            line = _TIMESTAMP_RE.sub('', line).strip()  # Remove timestamp from the line
 
             if not line:  # Skip if the line is empty after removing the timestamp
                 continue
@@ -463,6 +631,12 @@ def lyricSplit(lyrics):
                 _LOGGER.warning("Invalid timestamp format: %s", _time)
                 continue
 
+    # The synchronizer binary-searches the timeline, so make sure it is in time order
+    if any(later < earlier for earlier, later in zip(timeline, timeline[1:])):
+        pairs = sorted(zip(timeline, lrc), key=lambda pair: pair[0])
+        timeline = [pair[0] for pair in pairs]
+        lrc = [pair[1] for pair in pairs]
+
     return timeline, lrc
 
 
@@ -579,17 +753,27 @@ async def update_lyrics_input_text(hass: HomeAssistant, previous_line: str, curr
     lyrics_entities = get_device_lyrics_entities(hass, entry_id)
     
     # Check if entities exist before trying to update them
-    entities_exist = all(hass.states.get(entity_id) for entity_id in lyrics_entities.values())
+    entity_states = {line: hass.states.get(entity_id) for line, entity_id in lyrics_entities.items()}
     
-    if not entities_exist:
+    if not all(entity_states.values()):
         _LOGGER.warning("Lyrics entities not found for device %s. Expected: %s", entry_id, list(lyrics_entities.values()))
         return
     
-    await hass.services.async_call("text", "set_value", {"entity_id": lyrics_entities["line1"], "value": previous_line})
-    await hass.services.async_call("text", "set_value", {"entity_id": lyrics_entities["line2"], "value": current_line})
-    await hass.services.async_call("text", "set_value", {"entity_id": lyrics_entities["line3"], "value": next_line})
+    # Only write the lines that changed, and send those updates concurrently
+    new_values = {"line1": previous_line, "line2": current_line, "line3": next_line}
+    calls = [
+        hass.services.async_call("text", "set_value", {"entity_id": lyrics_entities[line], "value": value})
+        for line, value in new_values.items()
+        if entity_states[line].state != value
+    ]
+    
+    if calls:
+        await asyncio.gather(*calls)
 
 
+# Cleaning is pure and the same title is cleaned repeatedly while a track plays,
+# so results are cached
+@functools.lru_cache(maxsize=256)
 def clean_track_name(track):
     """Improved function to clean up track names."""
     if not track:
@@ -597,66 +781,148 @@ def clean_track_name(track):
     
     original_track = track
 
-    _LOGGER.info("Pre-cleaned up track = %s", track)
+    _LOGGER.debug("Pre-cleaned up track = %s", track)
+    
+    # Cheap substring checks let plain titles skip the passes that can't match them
     
     # 1. Handle nested brackets by recursively removing them from the outermost in
-    while re.search(r'\s*[\(\[\{\<].*?[\)\]\}\>]', track):
-        track = re.sub(r'\s*[\(\[\{\<].*?[\)\]\}\>]', '', track)
+    if any(bracket in track for bracket in "([{<"):
+        while _BRACKET_RE.search(track):
+            track = _BRACKET_RE.sub('', track)
     
     # 2. Remove dates in various formats (1999, '99, etc.)
-    track = re.sub(r'\b\d{4}\b', '', track)
-    track = re.sub(r'\b\'\d{2}\b', '', track)
+    track = _YEAR_RE.sub('', track)
     
     # 3. More careful handling of dashes - only split on dashes surrounded by spaces
     # or dashes followed by specific version-related words
-    dash_pattern = r'\s+-\s+|\s*-\s*(?:remaster|version|edit|mix|single|live|from)\b'
-    parts = re.split(dash_pattern, track, flags=re.IGNORECASE)
-    track = parts[0]
+    if "-" in track:
+        track = _DASH_RE.split(track, maxsplit=1)[0]
     
     # 4. Remove common phrases
-    common_phrases = [
-        r'\b(?:from|on)\s+(?:the\s+)?(?:"[^"]*"|\'[^\']*\'|\S+)?\s*(?:soundtrack|album|movie|film|series|show)\b',
-        r'\b(?:original|movie|film|radio|single|album|instrumental|acoustic|live|studio|extended|shortened)\s+(?:version|edit|mix|cut|recording)\b',
-        r'\b(?:remaster(?:ed)?|remix(?:ed)?|feat\.?|ft\.?|featuring)\b',
-        r'\b(?:bonus\s+track|deluxe\s+edition|digital\s+exclusive)\b',
-        r'\b(?:explicit|clean)\s+(?:version|edit)?\b',
-        r'\d+(?:th|st|nd|rd)?\s+(?:anniversary|edition)\b',
-        r'\b(?:anthology|world\s+wildlife\s+fund)\s+(?:version)?\b'
-    ]
-    
-    for phrase in common_phrases:
-        track = re.sub(phrase, '', track, flags=re.IGNORECASE)
+    track = _COMMON_PHRASE_RE.sub('', track)
     
     # 5. Remove non-Latin characters while preserving accented characters
-    track = re.sub(r'[^\x00-\x7F\xC0-\xFF\u2000-\u206F]', '', track)
+    if not track.isascii():
+        track = _NON_LATIN_RE.sub('', track)
     
     # 6. Normalize quotes and apostrophes
-    track = track.replace("'", "'").replace(""", '"').replace(""", '"').replace("´", "'").replace("`", "'")
+    track = track.translate(_QUOTE_TABLE)
     
     # 7. Replace multiple spaces with a single space
-    track = re.sub(r'\s+', ' ', track)
+    track = _MULTISPACE_RE.sub(' ', track)
     
     # 8. Trim whitespace and remove trailing punctuation
     track = track.strip()
-    track = re.sub(r'[.,;:!?]+$', '', track).strip()
+    track = _TRAIL_PUNCT_RE.sub('', track).strip()
     
     # 9. Check if we've removed everything - if so, return at least part of the original
     if len(track) < 2 and len(original_track) > 0:
         # Try to extract any word characters from the original
-        words = re.findall(r'\b[A-Za-z]+\b', original_track)
+        words = _WORD_RE.findall(original_track)
         if words:
             return ' '.join(words)
         # If no words, return the original but cleaned of special characters
-        return re.sub(r'[^\w\s]', '', original_track).strip()
+        return _SPECIAL_CHARS_RE.sub('', original_track).strip()
     
-    _LOGGER.info("Cleaned up track = %s", track)
+    _LOGGER.debug("Cleaned up track = %s", track)
     
     return track
 
 
-def get_media_player_info(hass: HomeAssistant, entity_id: str, entry_id: str = None):
-    """Retrieve track, artist, media position, and last update time from media player."""
-    player_state = hass.states.get(entity_id)
+def _lyrics_cache_key(artist: str, track: str):
+    """Return the cache key for a song, ignoring case and surrounding whitespace."""
+    return (artist.lower().strip(), track.lower().strip())
+
+
+def _get_cached_lyrics(artist: str, track: str):
+    """Return the cached (timeline, lyrics) for a song, or None on a miss or expired entry.
+
+    A cached negative result is returned as (None, None) for "not found" or
+    ([], []) for lyrics without timestamps.
+    """
+    key = _lyrics_cache_key(artist, track)
+    cached = _LYRICS_CACHE.get(key)
+    if cached is None:
+        return None
+    timeline, lrc, expires_at = cached
+    if time.monotonic() >= expires_at:
+        del _LYRICS_CACHE[key]
+        return None
+    _LYRICS_CACHE.move_to_end(key)
+    return timeline, lrc
+
+
+def _cache_lyrics(artist: str, track: str, timeline, lrc):
+    """Remember a lookup result for a song, evicting the least recently used entry when full."""
+    ttl = _LYRICS_CACHE_TTL if timeline else _LYRICS_CACHE_NEGATIVE_TTL
+    key = _lyrics_cache_key(artist, track)
+    _LYRICS_CACHE[key] = (timeline, lrc, time.monotonic() + ttl)
+    _LYRICS_CACHE.move_to_end(key)
+    if len(_LYRICS_CACHE) > _LYRICS_CACHE_SIZE:
+        _LYRICS_CACHE.popitem(last=False)
+
+
+@callback
+def _lookup_done(key, lookup: asyncio.Task) -> None:
+    """Forget a finished lookup and retrieve its exception.
+
+    Every caller may have been cancelled by the time the lookup fails, so the
+    exception is retrieved here to keep asyncio from logging it as unretrieved.
+    """
+    if _INFLIGHT_LOOKUPS.get(key) is lookup:
+        del _INFLIGHT_LOOKUPS[key]
+    if not lookup.cancelled():
+        lookup.exception()
+
+
+async def _async_lookup_lyrics(hass: HomeAssistant, artist: str, track: str, entry_id: str = None):
+    """Return (timeline, lyrics) for a song from the cache or the lyrics provider.
+
+    timeline is None when no lyrics were found and empty when the lyrics
+    have no timestamps.
+    """
+    # Reuse the result of a recent lookup of the same song (e.g. a radio station replaying it)
+    cached = _get_cached_lyrics(artist, track)
+    if cached is not None:
+        _LOGGER.info("Fetch: Using cached lyrics result for '%s' (device: %s)", track, entry_id)
+        return cached
+    
+    # Concurrent lookups of the same song (e.g. the playback monitor and a
+    # fingerprint match racing each other) share a single provider request.
+    # The lookup runs as its own task so a cancelled caller doesn't cancel it
+    # for the others.
+    key = _lyrics_cache_key(artist, track)
+    lookup = _INFLIGHT_LOOKUPS.get(key)
+    if lookup is None:
+        lookup = hass.async_create_task(_async_fetch_lyrics(hass, artist, track, entry_id), eager_start=True)
+        _INFLIGHT_LOOKUPS[key] = lookup
+        lookup.add_done_callback(functools.partial(_lookup_done, key))
+    else:
+        _LOGGER.info("Fetch: Joining lyrics lookup already in progress for '%s' (device: %s)", track, entry_id)
+    
+    return await asyncio.shield(lookup)
+
+
+async def _async_fetch_lyrics(hass: HomeAssistant, artist: str, track: str, entry_id: str = None):
+    """Search the lyrics provider for a song, parse and cache the result."""
+    lyrics_result = await _async_search_lyrics(hass, artist, track, entry_id)
+    if lyrics_result:
+        _LOGGER.info("Fetch: Processing lyrics into timeline (device: %s)", entry_id)
+        timeline, lrc = lyricSplit(str(lyrics_result))
+    else:
+        timeline, lrc = None, None
+    
+    _cache_lyrics(artist, track, timeline, lrc)
+    return timeline, lrc
+
+
+def get_media_player_info(hass: HomeAssistant, entity_id: str, entry_id: str = None, player_state=None):
+    """Retrieve track, artist, media position, and last update time from media player.
+    
+    Callers that already hold the player's State can pass it to skip the lookup.
+    """
+    if player_state is None:
+        player_state = hass.states.get(entity_id)
 
     if not player_state:
         _LOGGER.error("Get Media Info: Media player entity not found (device: %s).", entry_id)
@@ -668,10 +934,11 @@ def get_media_player_info(hass: HomeAssistant, entity_id: str, entry_id: str = N
         hass.async_create_task(update_lyrics_display(hass, "Waiting for playback to start", "", "", entry_id))
         return None, None, None, None
 
-    track = clean_track_name(player_state.attributes.get("media_title", ""))
-    artist = player_state.attributes.get("media_artist", "")
-    pos = player_state.attributes.get("media_position")
-    updated_at = player_state.attributes.get("media_position_updated_at")
+    attrs = player_state.attributes
+    track = clean_track_name(attrs.get("media_title", ""))
+    artist = attrs.get("media_artist", "")
+    pos = attrs.get("media_position")
+    updated_at = attrs.get("media_position_updated_at")
 
     if not track or not artist:
         _LOGGER.warning("Get Media Info: Missing track or artist information (device: %s).", entry_id)
@@ -681,6 +948,47 @@ def get_media_player_info(hass: HomeAssistant, entity_id: str, entry_id: str = N
     return track, artist, pos, updated_at
 
 
+async def _async_search_lyrics(hass: HomeAssistant, artist: str, track: str, entry_id: str = None):
+    """Search for lyrics, retrying with each artist when a combined artist name finds nothing."""
+    # Load lyrics provider (async, on Home Assistant's shared HTTP session)
+    provider = QQLyricsProvider(hass)
+    
+    # Try with the combined artist name first
+    _LOGGER.info("Fetch: Searching for lyrics with combined artist name (device: %s).", entry_id)
+    lyrics_result = await provider.search(artist, track)
+    
+    # If no lyrics found and artist contains separators, try with individual artists
+    if not lyrics_result:
+        # Define common artist separators
+        separators = ["/", "|", "&", ",", " and ", " with ", " feat ", " feat. ", " ft ", " ft. ", " featuring "]
+        
+        # Check if any separator is in the artist name
+        contains_separator = any(sep in artist for sep in separators)
+        
+        if contains_separator:
+            _LOGGER.info("Fetch: No lyrics found with combined artist name. Trying individual artists (device: %s).", entry_id)
+            
+            # Split the artist string using multiple possible separators
+            individual_artists = artist
+            for sep in separators:
+                if sep in individual_artists:
+                    individual_artists = individual_artists.replace(sep, "|")  # Normalize to one separator
+            
+            # Split by the normalized separator and strip whitespace
+            artist_list = [a.strip() for a in individual_artists.split("|") if a.strip()]
+            
+            # Try each individual artist
+            for single_artist in artist_list:
+                _LOGGER.info("Fetch: Trying with artist: %s (device: %s)", single_artist, entry_id)
+                lyrics_result = await provider.search(single_artist, track)
+                
+                if lyrics_result:
+                    _LOGGER.info("Fetch: Lyrics found with artist: %s (device: %s)", single_artist, entry_id)
+                    break
+    
+    return lyrics_result
+
+
 async def fetch_lyrics_for_track(hass: HomeAssistant, track: str, artist: str, pos, updated_at, entity_id, audiofingerprint, entry_id: str = None):
     """Fetch lyrics for a given track and synchronize with playback."""
     device_data = get_device_data(hass, entry_id)
@@ -691,13 +999,16 @@ async def fetch_lyrics_for_track(hass: HomeAssistant, track: str, artist: str, p
     # Reset the current display first to show we're working on it
     await update_lyrics_display(hass, "", "Searching for lyrics...", "", entry_id)
 
+    # Look up the player state once for the position fallback and track comparison below
+    player_state = hass.states.get(entity_id)
+    attrs = player_state.attributes if player_state else {}
+
     # Ensure parameters are valid
     if pos is None or updated_at is None:
         # Try to get current position if not provided
-        player_state = hass.states.get(entity_id)
         if player_state and player_state.state == "playing":
-            pos = player_state.attributes.get("media_position")
-            updated_at = player_state.attributes.get("media_position_updated_at")
+            pos = attrs.get("media_position")
+            updated_at = attrs.get("media_position_updated_at")
             _LOGGER.info("Fetch: Retrieved current position: pos=%s, updated_at=%s (device: %s)", pos, updated_at, entry_id)
         
         # If still not available, exit
@@ -712,10 +1023,9 @@ async def fetch_lyrics_for_track(hass: HomeAssistant, track: str, artist: str, p
     # (No more device-specific enable/disable switch)
 
     # Get current media_content_id for tracking
-    player_state = hass.states.get(entity_id)
-    current_track = player_state.attributes.get("media_title", "") if player_state else ""
-    current_artist = player_state.attributes.get("media_artist", "") if player_state else ""
-    current_media_id = player_state.attributes.get("media_content_id", "") if player_state else ""
+    current_track = attrs.get("media_title", "")
+    current_artist = attrs.get("media_artist", "")
+    current_media_id = attrs.get("media_content_id", "")
     
     # Always stop existing lyrics if this is a fingerprint-based identification
     # This allows for correction of misidentified tracks
@@ -723,7 +1033,7 @@ async def fetch_lyrics_for_track(hass: HomeAssistant, track: str, artist: str, p
     
     # For non-fingerprint calls, check if we already have lyrics running for this track
     active_lyrics_sync = device_data.get(DEVICE_DATA_LYRICS_SYNC)
-    if not audiofingerprint and active_lyrics_sync and active_lyrics_sync.active:
+    if not audiofingerprint and active_lyrics_sync and active_lyrics_sync.active and not active_lyrics_sync.suspended:
         # Check if we're already displaying lyrics for this track/artist
         if (active_lyrics_sync.media_tracker and 
             active_lyrics_sync.media_tracker.current_track == current_track and
@@ -732,64 +1042,29 @@ async def fetch_lyrics_for_track(hass: HomeAssistant, track: str, artist: str, p
             should_stop_existing = False
             return
     
-    # Stop any existing lyrics synchronization if needed
+    # Suspend any existing lyrics synchronization if needed; it is retargeted to
+    # the new lyrics below instead of being torn down and rebuilt
     if should_stop_existing and active_lyrics_sync and active_lyrics_sync.active:
-        _LOGGER.info("Fetch: Stopping current lyrics session for new request (device: %s).", entry_id)
-        await active_lyrics_sync.stop()
+        _LOGGER.info("Fetch: Suspending current lyrics session for new request (device: %s).", entry_id)
+        await active_lyrics_sync.suspend(clear_display=False)
     
     # Update the last media content ID
-    device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID] = current_media_id
+    device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID][entity_id] = current_media_id
     
     _LOGGER.info("Fetch: Start new session (device: %s)", entry_id)
     
-    # Load lyrics provider
-    lyrics_provider = [lrc_kit.QQProvider]
-    provider = lrc_kit.ComboLyricsProvider(lyrics_provider)
-    
-    # Try with the combined artist name first
-    _LOGGER.info("Fetch: Searching for lyrics with combined artist name (device: %s).", entry_id)
-    search_request = await hass.async_add_executor_job(lrc_kit.SearchRequest, artist, track)
-    lyrics_result = await hass.async_add_executor_job(provider.search, search_request)
+    timeline, lrc = await _async_lookup_lyrics(hass, artist, track, entry_id)
     
-    # If no lyrics found and artist contains separators, try with individual artists
-    if not lyrics_result:
-        # Define common artist separators
-        separators = ["/", "|", "&", ",", " and ", " with ", " feat ", " feat. ", " ft ", " ft. ", " featuring "]
-        
-        # Check if any separator is in the artist name
-        contains_separator = any(sep in artist for sep in separators)
-        
-        if contains_separator:
-            _LOGGER.info("Fetch: No lyrics found with combined artist name. Trying individual artists (device: %s).", entry_id)
-            
-            # Split the artist string using multiple possible separators
-            individual_artists = artist
-            for sep in separators:
-                if sep in individual_artists:
-                    individual_artists = individual_artists.replace(sep, "|")  # Normalize to one separator
-            
-            # Split by the normalized separator and strip whitespace
-            artist_list = [a.strip() for a in individual_artists.split("|") if a.strip()]
-            
-            # Try each individual artist
-            for single_artist in artist_list:
-                _LOGGER.info("Fetch: Trying with artist: %s (device: %s)", single_artist, entry_id)
-                search_request = await hass.async_add_executor_job(lrc_kit.SearchRequest, single_artist, track)
-                lyrics_result = await hass.async_add_executor_job(provider.search, search_request)
-                
-                if lyrics_result:
-                    _LOGGER.info("Fetch: Lyrics found with artist: %s (device: %s)", single_artist, entry_id)
-                    break
+    # Without usable lyrics the suspended session has nothing to switch to
+    if not timeline and active_lyrics_sync and active_lyrics_sync.active:
+        await active_lyrics_sync.stop()
     
     # If still no lyrics found
-    if not lyrics_result:
+    if timeline is None:
         _LOGGER.warning("Fetch: No lyrics found for '%s' (device: %s).", track, entry_id)
         await update_lyrics_display(hass, "", "No lyrics found", "", entry_id)
         return
 
-    _LOGGER.info("Fetch: Processing lyrics into timeline (device: %s)", entry_id)
-    timeline, lrc = lyricSplit(str(lyrics_result))
-
     if not timeline:
         _LOGGER.error("Fetch: Lyrics have no timeline (device: %s).", entry_id)
         await update_lyrics_display(hass, "", "Lyrics not synced", "", entry_id)
@@ -805,8 +1080,13 @@ async def fetch_lyrics_for_track(hass: HomeAssistant, track: str, artist: str, p
     if not device_data.get(DEVICE_DATA_LYRICS_SYNC):
         device_data[DEVICE_DATA_LYRICS_SYNC] = LyricsSynchronizer(hass, entry_id)
     
-    # Start synchronized lyrics display, passing the audiofingerprint flag
-    await device_data[DEVICE_DATA_LYRICS_SYNC].start(entity_id, timeline, lrc, pos, updated_at, audiofingerprint)
+    # Switch a running session for this player over to the new lyrics, keeping its
+    # media tracker; otherwise start a new session. Both take the audiofingerprint flag.
+    lyrics_sync = device_data[DEVICE_DATA_LYRICS_SYNC]
+    if lyrics_sync.can_retarget(entity_id):
+        await lyrics_sync.async_retarget(timeline, lrc, pos, updated_at, audiofingerprint)
+    else:
+        await lyrics_sync.start(entity_id, timeline, lrc, pos, updated_at, audiofingerprint)
 
 
 async def trigger_lyrics_lookup(hass: HomeAssistant, title: str, artist: str, play_offset_ms: int, process_begin: str, entry_id=None):
@@ -827,10 +1107,140 @@ async def trigger_lyrics_lookup(hass: HomeAssistant, title: str, artist: str, pl
         
     media_player = conf["media_player"]
 
-    clean_track = clean_track_name(title)
+    # clean_track_name is memoized; stripping first lets titles that only differ in
+    # surrounding whitespace share a cache entry
+    clean_track = clean_track_name(title.strip())
     await fetch_lyrics_for_track(hass, clean_track, artist, play_offset_ms/1000, process_begin, media_player, True, entry_id)
 
 
+class _PlaybackMonitor:
+    """Follow a media player and fetch lyrics whenever a new track starts playing."""
+    
+    __slots__ = ("hass", "entity_id", "entry_id", "device_data", "_debouncer", "_unsub")
+    
+    def __init__(self, hass: HomeAssistant, entity_id: str, entry_id: str, device_data: dict):
+        self.hass = hass
+        self.entity_id = entity_id
+        self.entry_id = entry_id
+        self.device_data = device_data
+        
+        # Track changes often arrive as several state changes in quick succession
+        # (content id, state and position flip separately). The lookup runs once the
+        # 250 ms cooldown after the first change ends; changes during the cooldown
+        # only queue one more run. This is not a trailing-edge debounce: the lookup
+        # re-reads the player state and skips content ids it has already handled.
+        self._debouncer = Debouncer(
+            hass, _LOGGER, cooldown=0.25, immediate=False, function=self._async_handle_new_track
+        )
+        self._unsub = async_track_state_change_event(hass, [entity_id], self._handle_event)
+    
+    @callback
+    def async_remove(self):
+        """Remove the state listener and drop any pending debounced lookup."""
+        self._unsub()
+        self._debouncer.async_cancel()
+    
+    async def _async_start_new_track(self, media_content_id, player_state):
+        """Blank the current lyrics and fetch lyrics for the newly playing track."""
+        entry_id = self.entry_id
+        track, artist, pos, updated_at = get_media_player_info(self.hass, self.entity_id, entry_id, player_state)
+        _LOGGER.info("Monitor Playback: New Info -> Artist %s, Track %s, media_content_id %s (device: %s)", 
+                    artist, track, media_content_id, entry_id)
+        _LOGGER.info("Monitor Playback: New Info -> pos %s, updated_at %s (device: %s)", pos, updated_at, entry_id)
+        
+        # Suspend any existing lyrics display; the fetch retargets it to the new track.
+        # The fetch immediately writes its "Searching for lyrics..." status, so the
+        # display is only cleared here when no fetch follows.
+        will_fetch = bool(track and artist)
+        active_lyrics_sync = self.device_data.get(DEVICE_DATA_LYRICS_SYNC)
+        if active_lyrics_sync and active_lyrics_sync.active:
+            await active_lyrics_sync.suspend(clear_display=not will_fetch)
+        elif not will_fetch:
+            await update_lyrics_display(self.hass, "", "", "", entry_id)
+
+        # Call the lyrics function and update the last processed ID
+        if will_fetch:
+            _LOGGER.debug("Monitor Playback: Fetching lyrics for new track (device: %s)", entry_id)
+            self.device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID][self.entity_id] = media_content_id
+            await fetch_lyrics_for_track(self.hass, track, artist, pos, updated_at, self.entity_id, False, entry_id)
+    
+    async def _async_handle_new_track(self):
+        """Fetch lyrics for the playing track once a burst of state changes has settled."""
+        # Re-read the state: the burst may have ended on a radio station or a stop
+        player_state = self.hass.states.get(self.entity_id)
+        if player_state is None or player_state.state != "playing":
+            return
+        media_content_id = player_state.attributes.get("media_content_id", "")
+        if (not media_content_id or media_content_id.startswith(_RADIO_PREFIX)
+                or media_content_id == self.device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID].get(self.entity_id)):
+            return
+        await self._async_start_new_track(media_content_id, player_state)
+    
+    async def _async_clear_for_radio(self):
+        """Stop the current lyrics when a radio station starts playing."""
+        # Stop any existing lyrics display
+        active_lyrics_sync = self.device_data.get(DEVICE_DATA_LYRICS_SYNC)
+        if active_lyrics_sync and active_lyrics_sync.active:
+            await active_lyrics_sync.stop()
+            
+        await update_lyrics_display(self.hass, "", "", "", self.entry_id)
+    
+    @callback
+    def _handle_event(self, event):
+        """Monitor media player state changes.
+        
+        Runs inline for every state change of the player; a task is only
+        created when the lyrics actually need to change.
+        """
+        new_state = event.data["new_state"]
+        if new_state is None:
+            return
+        old_state = event.data["old_state"]
+        
+        # Read everything from the event's state rather than querying the state machine again
+        state = new_state.state
+        media_content_id = new_state.attributes.get("media_content_id", "")
+
+        # Ignore updates if the state remains unchanged (e.g., volume changes)
+        if (old_state is not None and old_state.state == state
+                and old_state.attributes.get("media_content_id", "") == media_content_id):
+            return
+        
+        entry_id = self.entry_id
+        if state != "playing":
+            # Not playing, but lyrics display will be handled by MediaTracker
+            _LOGGER.info("Monitor Playback: Media player is not playing (device: %s).", entry_id)
+            return
+        
+        # Most remaining events are for content that was already handled (radio
+        # station or track), so return before doing any further work
+        last_media_content_ids = self.device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID]
+        last_media_content_id = last_media_content_ids.get(self.entity_id)
+        if media_content_id and media_content_id == last_media_content_id:
+            return
+        
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Monitor Playback: Media player state changed: %s -> %s (device: %s)", 
+                         old_state.state if old_state else "None", state, entry_id)
+            _LOGGER.debug("Monitor Playback: LAST_MEDIA_CONTENT_ID: %s (device: %s)", last_media_content_id, entry_id)
+            _LOGGER.debug("Monitor Playback: media_content_id: %s (device: %s)", media_content_id, entry_id)
+        
+        # Playing, radio
+        if media_content_id.startswith(_RADIO_PREFIX):
+            last_media_content_ids[self.entity_id] = media_content_id # Radio station, don't fetch lyrics
+            _LOGGER.info("Monitor Playback: Radio station detected (device: %s).", entry_id)
+            self.hass.async_create_task(self._async_clear_for_radio(), eager_start=True)
+            return
+        
+        # Playing, not a radio station
+        if not media_content_id:
+            _LOGGER.info("Monitor Playback: No media content id. Skipping lyrics fetch (device: %s).", entry_id)
+            return
+        
+        _LOGGER.info("Monitor Playback: Content has changed, not a radio station (device: %s).", entry_id)
+        self._debouncer.async_schedule_call()
+
+
 async def handle_fetch_lyrics(hass: HomeAssistant, call: ServiceCall):
     """Main service handler: gets media info and fetches lyrics."""
     entity_id = call.data.get("entity_id")
@@ -838,24 +1248,29 @@ async def handle_fetch_lyrics(hass: HomeAssistant, call: ServiceCall):
     # Try to find the matching device config for this entity
     entry_id = None
     if DOMAIN in hass.data:
-        _LOGGER.debug("Looking for device config matching entity: %s", entity_id)
-        _LOGGER.debug("Available entries: %s", list(hass.data[DOMAIN].keys()))
+        # The debug output below lists and dumps every entry, so only build it when it will be logged
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Looking for device config matching entity: %s", entity_id)
+            _LOGGER.debug("Available entries: %s", list(hass.data[DOMAIN].keys()))
         
         for eid, config_data in hass.data[DOMAIN].items():
             # Enhanced debugging to see what's in each entry
-            _LOGGER.debug("Processing entry %s: type=%s, content=%s", eid, type(config_data), config_data)
+            if debug:
+                _LOGGER.debug("Processing entry %s: type=%s, content=%s", eid, type(config_data), config_data)
             
             # Check for dict-like objects (including mappingproxy used by Home Assistant)
             if hasattr(config_data, 'get'):
                 entry_type = config_data.get("entry_type")
                 media_player = config_data.get("media_player_entity")
-                _LOGGER.debug("Entry %s: entry_type=%s, media_player=%s", eid, entry_type, media_player)
+                if debug:
+                    _LOGGER.debug("Entry %s: entry_type=%s, media_player=%s", eid, entry_type, media_player)
                 
                 if (entry_type == "device" and media_player == entity_id):
                     entry_id = eid
                     _LOGGER.debug("MATCH FOUND: %s", eid)
                     break
-            else:
+            elif debug:
                 _LOGGER.debug("Entry %s is not dict-like, it's a %s with value: %s", eid, type(config_data), config_data)
         
         if not entry_id:
@@ -874,85 +1289,24 @@ async def handle_fetch_lyrics(hass: HomeAssistant, call: ServiceCall):
     # Fetch and display lyrics
     await fetch_lyrics_for_track(hass, track, artist, pos, updated_at, entity_id, False, entry_id)
     
-    async def monitor_playback_event(event):
-        """Monitor media player state changes."""
-        entity = event.data.get('entity_id')
-        old_state = event.data.get('old_state')
-        new_state = event.data.get('new_state')
-        
-        device_data = get_device_data(hass, entry_id)
-
-        _LOGGER.debug("Monitor Playback: Media player state changed: %s -> %s (device: %s)", 
-                     old_state.state if old_state else "None", new_state.state, entry_id)
-
-        media_content_id = hass.states.get(entity).attributes.get("media_content_id", "")
-
-        # Ignore updates if the state remains unchanged (e.g., volume changes)
-        if old_state and new_state and old_state.state == new_state.state:
-            if old_state.attributes.get("media_content_id") == media_content_id:
-                _LOGGER.debug("Monitor Playback: State unchanged and media_content_id unchanged. Ignoring attribute-only update (device: %s).", entry_id)
-                return
-            
-        # Only act if the player changes to 'playing' and it's not a radio station
-        if new_state.state == "playing" and not media_content_id.startswith("library://radio"):
-            
-            last_media_content_id = device_data.get(DEVICE_DATA_LAST_MEDIA_CONTENT_ID)
-            _LOGGER.debug("Monitor Playback: LAST_MEDIA_CONTENT_ID: %s (device: %s)", last_media_content_id, entry_id)
-            _LOGGER.debug("Monitor Playback: media_content_id: %s (device: %s)", media_content_id, entry_id)
-
-            # Check if the media_content_id is different from the last one processed
-            if media_content_id and media_content_id != last_media_content_id:
-                _LOGGER.info("Monitor Playback: Content has changed, not a radio station (device: %s).", entry_id)
-                
-                # Stop any existing lyrics display
-                active_lyrics_sync = device_data.get(DEVICE_DATA_LYRICS_SYNC)
-                if active_lyrics_sync and active_lyrics_sync.active:
-                    await active_lyrics_sync.stop()
-                
-                await update_lyrics_display(hass, "", "", "", entry_id)
-                track, artist, pos, updated_at = get_media_player_info(hass, entity, entry_id)
-                _LOGGER.info("Monitor Playback: New Info -> Artist %s, Track %s, media_content_id %s (device: %s)", 
-                            artist, track, media_content_id, entry_id)
-                _LOGGER.info("Monitor Playback: New Info -> pos %s, updated_at %s (device: %s)", pos, updated_at, entry_id)
-
-                # Call the lyrics function and update the last processed ID
-                if track and artist:
-                    _LOGGER.debug("Monitor Playback: Fetching lyrics for new track (device: %s)", entry_id)
-                    device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID] = media_content_id
-                    hass.async_create_task(fetch_lyrics_for_track(hass, track, artist, pos, updated_at, entity, False, entry_id))
-            else:
-                _LOGGER.info("Monitor Playback: Track already processed. Skipping lyrics fetch (device: %s).", entry_id)
-        # Playing, radio
-        elif new_state.state == "playing" and media_content_id.startswith("library://radio"):
-            device_data[DEVICE_DATA_LAST_MEDIA_CONTENT_ID] = media_content_id # Radio station, don't fetch lyrics
-            _LOGGER.info("Monitor Playback: Radio station detected (device: %s).", entry_id)
-            
-            # Stop any existing lyrics display
-            active_lyrics_sync = device_data.get(DEVICE_DATA_LYRICS_SYNC)
-            if active_lyrics_sync and active_lyrics_sync.active:
-                await active_lyrics_sync.stop()
-                
-            await update_lyrics_display(hass, "", "", "", entry_id)
-        else:
-            # Not playing, but lyrics display will be handled by MediaTracker
-            _LOGGER.info("Monitor Playback: Media player is not playing (device: %s).", entry_id)
-
-    # Register listener for state change events
-    async_track_state_change_event(hass, [entity_id], monitor_playback_event)
+    # Register listener for state change events, replacing any earlier listener for
+    # this player so repeated fetch_lyrics calls don't stack up duplicate handlers
+    device_data = get_device_data(hass, entry_id)
+    playback_listeners = device_data.setdefault(DEVICE_DATA_PLAYBACK_LISTENERS, {})
+    if entity_id in playback_listeners:
+        playback_listeners.pop(entity_id)()
+    monitor = _PlaybackMonitor(hass, entity_id, entry_id, device_data)
+    playback_listeners[entity_id] = monitor.async_remove
     _LOGGER.debug("Registered state change listener for: %s (device: %s)", entity_id, entry_id)
 
-
 async def async_setup_lyrics_service(hass: HomeAssistant):
     """Register the fetch_lyrics service."""
     _LOGGER.debug("Registering the fetch_lyrics service.")
 
-    async def async_wrapper(call):
-        await handle_fetch_lyrics(hass, call)
-
     hass.services.async_register(
         DOMAIN,  # Use DOMAIN constant instead of hardcoded string
         "fetch_lyrics",
-        async_wrapper,
+        functools.partial(handle_fetch_lyrics, hass),
         schema=SERVICE_FETCH_LYRICS_SCHEMA
     )
 
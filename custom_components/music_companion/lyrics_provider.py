@@ -0,0 +1,81 @@
+"""Async lyrics provider for the QQ Music lyrics API."""
+import asyncio
+import base64
+import binascii
+import html
+import json
+import logging
+
+import aiohttp
+import lrc_kit
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+_LOGGER = logging.getLogger(__name__)
+
+QQ_SEARCH_URL = "https://c.y.qq.com/soso/fcgi-bin/client_search_cp"
+QQ_LYRIC_URL = "https://c.y.qq.com/lyric/fcgi-bin/fcg_query_lyric_new.fcg"
+QQ_LYRIC_HEADERS = {"Referer": "y.qq.com/portal/player.html"}
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+class QQLyricsProvider:
+    """Search and fetch synced lyrics from QQ Music.
+
+    Mirrors lrc_kit's QQProvider, but runs on Home Assistant's shared aiohttp
+    session so connections are kept alive between lookups instead of opening
+    a new requests session in the executor for every track.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.session = async_get_clientsession(hass)
+
+    async def search(self, artist: str, track: str):
+        """Return lrc_kit Lyrics for the artist and track, or None if not found."""
+        # Same normalisation as lrc_kit.SearchRequest
+        artist = artist.lower().strip()
+        track = track.lower().strip()
+
+        try:
+            song_id = await self._search_song_id(artist, track)
+            if not song_id:
+                return None
+            return await self._fetch(song_id)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.warning("QQ lyrics request failed for '%s' by '%s': %s", track, artist, e)
+        except (ValueError, KeyError, IndexError, TypeError, binascii.Error) as e:
+            _LOGGER.warning("Unexpected QQ lyrics response for '%s' by '%s': %s", track, artist, e)
+        return None
+
+    async def _search_song_id(self, artist: str, track: str):
+        """Return the QQ song id exactly matching the artist and track."""
+        params = {"w": f"{artist} {track}"}
+        async with self.session.get(QQ_SEARCH_URL, params=params, timeout=REQUEST_TIMEOUT) as resp:
+            text = await resp.text()
+
+        # The response is JSONP wrapped in "callback(...)"
+        songs = json.loads(text[9:-1])["data"]["song"]["list"]
+        _LOGGER.debug("QQ lyrics search returned %d results", len(songs))
+
+        for song in songs:
+            if song["songname"].lower() == track and song["singer"][0]["name"].lower() == artist:
+                return song["songmid"]
+        return None
+
+    async def _fetch(self, song_id: str):
+        """Fetch and parse the LRC lyrics for a QQ song id."""
+        params = {"songmid": song_id, "g_tk": 5381}
+        async with self.session.get(
+            QQ_LYRIC_URL, params=params, headers=QQ_LYRIC_HEADERS, timeout=REQUEST_TIMEOUT
+        ) as resp:
+            text = await resp.text()
+
+        # The response is JSONP wrapped in "MusicJsonCallback(...)"
+        body = json.loads(text[18:-1])
+        if not body.get("lyric"):
+            return None
+
+        lyric_text = html.unescape(base64.b64decode(body["lyric"]).decode("utf-8"))
+        if "[" in lyric_text and "]" in lyric_text:
+            return lrc_kit.Lyrics(lyric_text)
+        return None
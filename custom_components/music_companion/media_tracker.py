@@ -2,7 +2,7 @@ import logging
 import datetime
 import asyncio
 from typing import Optional, Callable
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 
 _LOGGER = logging.getLogger(__name__)
@@ -12,21 +12,26 @@ class MediaTracker:
     
     def __init__(self, hass: HomeAssistant, entity_id: str, 
                  position_callback=None, track_change_callback=None,
-                 is_radio_source=False, entry_id: str = None):
+                 is_radio_source=False, entry_id: str = None,
+                 playback_state_callback=None):
         """Initialize the MediaTracker.
         
         Args:
             hass: HomeAssistant instance
             entity_id: Media player entity ID to monitor
-            position_callback: Called when position updates with current timecode
-            track_change_callback: Called when track changes or seek detected
+            position_callback: Coroutine awaited when position updates with current timecode
+            track_change_callback: Coroutine scheduled when track changes or seek detected
             is_radio_source: True if source is radio/fingerprinted audio
             entry_id: Device entry ID for logging purposes
+            playback_state_callback: Callback run in the event loop with True when
+                playback starts or resumes and False when it pauses or stops
         """
         self.hass = hass
+        self._loop = hass.loop
         self.entity_id = entity_id
         self.position_callback = position_callback
         self.track_change_callback = track_change_callback
+        self.playback_state_callback = playback_state_callback
         self.is_radio_source = is_radio_source  # Flag for radio sources
         self.entry_id = entry_id  # Device identifier for logging
         
@@ -40,10 +45,14 @@ class MediaTracker:
         self.media_position = None
         self.position_updated_at = None
         self.last_calculated_position = 0
+        # Event loop time matching position_updated_at, so each tick only needs
+        # a subtraction. Reset to None whenever the position or timestamp changes.
+        self._position_anchor = None
         
         # Control flags
         self.tracking_active = False
         self.monitor_task = None
+        self._state_listener = None
         self.position_update_interval = 0.1  # seconds
         self.seek_threshold = 6.0  # seconds - difference that indicates a seek operation
         
@@ -77,6 +86,11 @@ class MediaTracker:
         """Stop tracking the media player state."""
         self.tracking_active = False
         
+        # Unsubscribe from state changes so a stopped tracker no longer drives its callbacks
+        if self._state_listener:
+            self._state_listener()
+            self._state_listener = None
+        
         if self.monitor_task:
             self.monitor_task.cancel()
             try:
@@ -135,6 +149,7 @@ class MediaTracker:
                             self.position_updated_at = datetime.datetime.fromisoformat(self.position_updated_at)
                         
                         self.position_updated_at += datetime.timedelta(seconds=pause_duration)
+                        self._position_anchor = None
                         _LOGGER.debug("MediaTracker: Adjusted position_updated_at by %s seconds after pause (device: %s)", 
                                      pause_duration, self.entry_id)
         
@@ -155,6 +170,7 @@ class MediaTracker:
             old_position = self.media_position
             self.media_position = new_position
             self.position_updated_at = new_position_updated
+            self._position_anchor = None
             
             # If significant position change, treat as a seek for resyncing lyrics
             if old_position is not None and abs(new_position - old_position) > 2.0:
@@ -168,6 +184,7 @@ class MediaTracker:
         """
         self.media_position = position
         self.position_updated_at = updated_at
+        self._position_anchor = None
         self.paused_duration = 0  # Reset paused duration
         _LOGGER.info("MediaTracker: Set initial position to %.2f (device: %s)", position, self.entry_id)
 
@@ -179,20 +196,24 @@ class MediaTracker:
         if self.state != "playing":
             return self.media_position
         
-        # Convert position_updated_at to datetime if it's a string
-        if isinstance(self.position_updated_at, str):
-            try:
-                last_update_time = datetime.datetime.fromisoformat(self.position_updated_at)
-            except ValueError:
-                _LOGGER.error("MediaTracker: Error parsing position_updated_at timestamp: %s (device: %s)", 
-                             self.position_updated_at, self.entry_id)
-                return self.last_calculated_position
-        else:
-            last_update_time = self.position_updated_at
+        if self._position_anchor is None:
+            # Convert position_updated_at to datetime if it's a string
+            if isinstance(self.position_updated_at, str):
+                try:
+                    last_update_time = datetime.datetime.fromisoformat(self.position_updated_at)
+                except ValueError:
+                    _LOGGER.error("MediaTracker: Error parsing position_updated_at timestamp: %s (device: %s)", 
+                                 self.position_updated_at, self.entry_id)
+                    return self.last_calculated_position
+            else:
+                last_update_time = self.position_updated_at
+            
+            # Translate the wall clock timestamp to event loop time once
+            since_update = (datetime.datetime.now(datetime.timezone.utc) - last_update_time).total_seconds()
+            self._position_anchor = self._loop.time() - since_update
         
         # Calculate elapsed time since position update
-        current_time = datetime.datetime.now(datetime.timezone.utc)
-        elapsed_time = (current_time - last_update_time).total_seconds()
+        elapsed_time = self._loop.time() - self._position_anchor
         
         # For radio sources, add a small acceleration factor to catch up if we started late
         # This helps compensate for delays in identification and processing
@@ -218,7 +239,10 @@ class MediaTracker:
                     
                     # Call the update callback with current position
                     if self.position_callback:
-                        self.position_callback(current_position)
+                        try:
+                            await self.position_callback(current_position)
+                        except Exception as e:
+                            _LOGGER.error("MediaTracker: Error in position callback (device: %s): %s", self.entry_id, str(e))
                     
                     # Occasionally log the current position for debugging
                     if update_count % 100 == 0:
@@ -231,8 +255,13 @@ class MediaTracker:
         except Exception as e:
             _LOGGER.error("MediaTracker: Error in position monitor loop (device: %s): %s", self.entry_id, str(e))
     
-    async def _handle_state_change(self, event):
-        """Handle media player state changes."""
+    @callback
+    def _handle_state_change(self, event):
+        """Handle media player state changes.
+        
+        Runs inline in the event dispatch; a task is only created when the
+        change needs the track change callback.
+        """
         entity_id = event.data.get('entity_id')
         old_state = event.data.get('old_state')
         new_state = event.data.get('new_state')
@@ -252,8 +281,14 @@ class MediaTracker:
         new_media_id = attrs.get("media_content_id", "")
         
         # First update state to detect changes
+        was_playing = self.state == "playing"
         state_changed = self.update_from_state()
         
+        # Report pause/resume (after update_from_state has adjusted the position for it)
+        is_playing = self.state == "playing"
+        if is_playing != was_playing and self.playback_state_callback:
+            self.playback_state_callback(is_playing)
+        
         # Differentiate between track changes and position changes
         if state_changed:
             # Only treat it as a track change if the media_content_id changed or 
@@ -261,9 +296,9 @@ class MediaTracker:
             if new_media_id != old_media_id:
                 _LOGGER.info("MediaTracker: Media content ID changed - treating as track change (device: %s)", self.entry_id)
                 if self.track_change_callback:
-                    self.track_change_callback(True)  # True = actual track change
+                    self.hass.async_create_task(self.track_change_callback(True), eager_start=True)  # True = actual track change
             else:
                 # This is just a position change, trigger a resync
                 _LOGGER.debug("MediaTracker: Position changed but same track - resyncing (device: %s)", self.entry_id)
                 if self.track_change_callback:
-                    self.track_change_callback(False)  # False = just a position change
\ No newline at end of file
+                    self.hass.async_create_task(self.track_change_callback(False), eager_start=True)  # False = just a position change
\ No newline at end of file
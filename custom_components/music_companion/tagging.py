@@ -1,18 +1,19 @@
-import json
 import logging
 import socket
-import time
 import datetime
-import io
 import re
-import wave
+import struct
 import threading
 import voluptuous as vol
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
 import urllib.parse
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_registry import async_get
+from homeassistant.util.json import json_loads
 from acrcloud.recognizer import ACRCloudRecognizer, ACRCloudRecognizeType
 # Import trigger function from lyrics.py
 from .lyrics import trigger_lyrics_lookup, update_lyrics_input_text
@@ -30,17 +31,34 @@ CHUNK_SIZE = 4096
 SAMPLE_RATE = 16000
 CHANNELS = 1
 SAMPLE_WIDTH = 2
+# Requested kernel receive buffer; Linux clamps it to net.core.rmem_max, which can be
+# raised with "sysctl -w net.core.rmem_max=1048576" if the effective size is logged lower
+UDP_RECEIVE_BUFFER = 1 << 20
 
 # New constants for modified approach
 CHUNK_DURATION = 3  # Duration of each audio chunk in seconds
+# Receive buffer for one chunk, with room for bursts above the nominal stream rate
+CHUNK_BUFFER_SIZE = 2 * CHUNK_DURATION * SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH
 MAX_TOTAL_DURATION = 12  # Maximum total recording time in seconds
+# Recognition threads per tagging service; chunks are recorded while earlier ones are
+# still being recognized, so a slow ACRCloud response shouldn't hold up the next chunk
+RECOGNITION_WORKERS = 2
+
+# Canonical 44 byte PCM WAV header: RIFF chunk, fmt sub-chunk and data sub-chunk header
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+WAV_HEADER_SIZE = _WAV_HEADER.size
+
+# CJK unified ideographs stripped from ACRCloud metadata
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]+')
+# From this length on, clean_text strips CJK with str.translate instead of the regex
+_CJK_TRANSLATE_MIN_LENGTH = 64
 
 # Service Schema - Updated to handle optional tagging switch
 SERVICE_FETCH_AUDIO_TAG_SCHEMA = vol.Schema({
     vol.Optional("duration", default=MAX_TOTAL_DURATION): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
     vol.Optional("include_lyrics", default=True): vol.All(vol.Coerce(bool)),
     vol.Optional("add_to_spotify", default=True): vol.All(vol.Coerce(bool)),
-    vol.Optional("tagging_switch_entity_id"): cv.entity_id,  # Original parameter - your automation uses this
+    vol.Optional("tagging_switch_entity_id"): cv.entity_domain("switch"),  # Original parameter - your automation uses this
     vol.Optional("assist_satellite_entity"): cv.entity_id,   # Alternative way to specify
 })
 
@@ -67,14 +85,21 @@ def get_device_config(hass: HomeAssistant, entry_id=None):
     return None
 
 def get_device_configs(hass: HomeAssistant):
-    """Get all device configuration entries."""
+    """Get all device configuration entries.
+    
+    The list is cached in hass.data and dropped whenever a config entry is
+    set up or unloaded.
+    """
     if DOMAIN not in hass.data:
         return []
     
-    devices = []
-    for entry_id, data in hass.data[DOMAIN].items():
-        if hasattr(data, 'get') and data.get("entry_type") == ENTRY_TYPE_DEVICE:
-            devices.append((entry_id, data))
+    devices = hass.data[DOMAIN].get("_device_configs")
+    if devices is None:
+        devices = []
+        for entry_id, data in hass.data[DOMAIN].items():
+            if hasattr(data, 'get') and data.get("entry_type") == ENTRY_TYPE_DEVICE:
+                devices.append((entry_id, data))
+        hass.data[DOMAIN]["_device_configs"] = devices
     return devices
 
 def get_tagging_config(hass: HomeAssistant, entry_id=None):
@@ -124,7 +149,17 @@ def find_device_config_by_assist_satellite(hass: HomeAssistant, assist_satellite
 
 def clean_text(text):
     """Remove Chinese characters from the given text."""
-    return re.sub(r'[\u4e00-\u9fff]+', '', text).strip()
+    # ASCII text (the common case) can't contain CJK characters, so skip the regex
+    if text.isascii():
+        return text.strip()
+    if len(text) >= _CJK_TRANSLATE_MIN_LENGTH:
+        return text.translate(_cjk_drop_table()).strip()
+    return _CJK_RE.sub('', text).strip()
+
+@cache
+def _cjk_drop_table():
+    """Translation table deleting CJK unified ideographs, built on first use (about 1 MB)."""
+    return dict.fromkeys(range(0x4e00, 0xa000))
 
 def format_time(ms):
     """Convert milliseconds to MM:SS format."""
@@ -132,6 +167,45 @@ def format_time(ms):
     seconds = (ms % 60000) // 1000
     return f"{minutes}:{seconds:02d}"
 
+class _AudioProtocol(asyncio.DatagramProtocol):
+    """Collect incoming UDP audio datagrams while a chunk is being recorded."""
+
+    def __init__(self):
+        # Preallocated buffer holding a whole WAV file: the datagrams of a chunk are
+        # copied in after room for the header, which is filled in when the chunk ends.
+        # It is never resized, so memoryviews of earlier chunks stay valid.
+        self.buffer = bytearray(WAV_HEADER_SIZE + CHUNK_BUFFER_SIZE)
+        self.length = 0  # Bytes of PCM audio after the header
+        self.recording = False
+
+    def datagram_received(self, data, addr):
+        """Store a datagram; called by the event loop as soon as it arrives."""
+        if not self.recording:
+            return
+        end = self.length + len(data)
+        if end > CHUNK_BUFFER_SIZE:
+            return  # Buffer full, drop the rest of this chunk
+        self.buffer[WAV_HEADER_SIZE + self.length:WAV_HEADER_SIZE + end] = data
+        self.length = end
+
+    def finish_wav(self):
+        """Write the WAV header for the recorded audio and return a view of the file."""
+        # Keep whole frames only
+        data_size = self.length - self.length % (CHANNELS * SAMPLE_WIDTH)
+        _WAV_HEADER.pack_into(
+            self.buffer, 0,
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, CHANNELS, SAMPLE_RATE,
+            SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH, CHANNELS * SAMPLE_WIDTH, SAMPLE_WIDTH * 8,
+            b"data", data_size,
+        )
+        return memoryview(self.buffer)[:WAV_HEADER_SIZE + data_size]
+
+    def error_received(self, exc):
+        """Log socket errors reported by the transport."""
+        _LOGGER.error("Error receiving data: %s", exc)
+
+
 class TaggingService:
     """Service to listen for UDP audio samples and process them."""
     def __init__(self, hass: HomeAssistant, tagging_switch_entity_id, entry_id=None):
@@ -141,10 +215,15 @@ class TaggingService:
         # Validate the switch entity ID exists in Home Assistant (only if provided)
         if tagging_switch_entity_id:
             if not hass.states.get(tagging_switch_entity_id):
-                _LOGGER.error(f"Invalid tagging switch entity ID provided: {tagging_switch_entity_id}")
+                _LOGGER.error("Invalid tagging switch entity ID provided: %s", tagging_switch_entity_id)
                 raise ValueError(f"The provided switch entity ID '{tagging_switch_entity_id}' does not exist or is invalid")
             
         self.tagging_switch_entity_id = tagging_switch_entity_id
+        # Switch service calls are bound once; listen_for_audio makes them on every run
+        if tagging_switch_entity_id:
+            switch_data = {"entity_id": tagging_switch_entity_id}
+            self._switch_turn_on = partial(hass.services.async_call, "switch", "turn_on", switch_data)
+            self._switch_turn_off = partial(hass.services.async_call, "switch", "turn_off", switch_data)
 
         if self.hass:
             _LOGGER.debug("TaggingService initialized with hass.")
@@ -163,13 +242,15 @@ class TaggingService:
         if not conf.get("tagging_enabled", False):
             raise ValueError("Audio tagging is not enabled for this device. This device supports lyrics display only.")
 
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Allow reuse
-        self.sock.bind(("0.0.0.0", conf["port"]))
-        self.sock.setblocking(False)  # Set to non-blocking
+        # The UDP port is shared by every device of the master configuration, and
+        # Linux only delivers to the socket bound last, so the socket is opened for
+        # each run and closed again afterwards instead of being kept by the service
+        self.port = conf["port"]
         self.running = True
-
-        _LOGGER.info("Set up UDP on port %d", conf["port"])
+        
+        # Datagram endpoint, only open while listen_for_audio runs
+        self.transport = None
+        self.protocol = None
 
         self.config = {
             'host': conf["host"],
@@ -179,61 +260,97 @@ class TaggingService:
             'debug': False,
             'timeout': 10
         }
+        # Each recognition thread creates its own recognizer on first use, so
+        # concurrent chunks never share a recognizer instance
+        self._thread_local = threading.local()
 
         _LOGGER.debug("ACRCloud - host: %s, access_key: %s, port: %s", self.config['host'], self.config['access_key'], conf["port"])
         
-        self.recognizer = ACRCloudRecognizer(self.config)
+        # Dedicated recognition threads, so ACRCloud calls (up to the 10 s timeout)
+        # don't queue behind or starve other jobs in Home Assistant's shared executor
+        self._executor = ThreadPoolExecutor(max_workers=RECOGNITION_WORKERS, thread_name_prefix="music_companion_acr")
+
+    def _open_socket(self):
+        """Create the UDP socket bound to the tagging port."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Allow reuse
+            # A larger receive queue keeps bursts from being dropped by the kernel
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RECEIVE_BUFFER)
+            _LOGGER.debug("UDP receive buffer: requested %d bytes, effective %d bytes",
+                          UDP_RECEIVE_BUFFER, sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF))
+            sock.bind(("0.0.0.0", self.port))
+            sock.setblocking(False)  # Set to non-blocking
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    async def start_receiving(self):
+        """Open the UDP socket and attach a datagram endpoint to it."""
+        if self.transport is None:
+            loop = asyncio.get_running_loop()
+            self.transport, self.protocol = await loop.create_datagram_endpoint(
+                _AudioProtocol, sock=self._open_socket()
+            )
+            _LOGGER.info("Set up UDP on port %d", self.port)
+
+    def stop_receiving(self):
+        """Close the datagram endpoint and its socket."""
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+            self.protocol = None
 
     async def receive_udp_data(self, duration):
-        """Non-blocking UDP data reception using asyncio."""
-        loop = asyncio.get_running_loop()
-        data_buffer = []
+        """Collect the UDP audio datagrams that arrive within duration seconds.
+
+        The protocol appends datagrams from the event loop's reader callback as
+        they arrive, so this only has to wait for the recording window to end.
+        """
+        await self.start_receiving()
+        protocol = self.protocol
 
         _LOGGER.info("Recording for %d seconds...", duration)
 
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            try:
-                data, addr = await loop.sock_recvfrom(self.sock, CHUNK_SIZE)
-                data_buffer.append(data)
-            except BlockingIOError:
-                pass  # No data available yet, continue
-            except Exception as e:
-                _LOGGER.error(f"Error receiving data: {e}")
-                break
-            await asyncio.sleep(0.01)  # Yield control to the event loop
-
-        return data_buffer
-    
-    def _write_audio_file(self, filename, frames):
-        """Write audio data to a WAV file in a blocking way."""
-        with wave.open(filename, "wb") as wf:
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(SAMPLE_WIDTH)
-            wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(b"".join(frames))
-    
-    async def write_audio_file(self, filename, frames):
-        """Write audio data to a WAV file in a non-blocking way."""
-        await asyncio.to_thread(self._write_audio_file, filename, frames)
+        protocol.length = 0
+        protocol.recording = True
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            protocol.recording = False
 
-    async def recognize_audio(self, filename):
-        """Recognize audio file using ACRCloud."""
-        return await asyncio.to_thread(self.recognizer.recognize_by_file, filename, 0, CHUNK_DURATION)
+        # A view of the chunk as a WAV file; only valid until the next chunk is recorded
+        return protocol.finish_wav()
+    
+    def _recognize(self, wav_data):
+        """Recognize a WAV buffer with the calling thread's recognizer."""
+        recognizer = getattr(self._thread_local, "recognizer", None)
+        if recognizer is None:
+            recognizer = self._thread_local.recognizer = ACRCloudRecognizer(self.config)
+        return recognizer.recognize_by_filebuffer(wav_data, 0, CHUNK_DURATION)
+
+    async def recognize_audio(self, wav_data):
+        """Recognize an in-memory WAV file using ACRCloud."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._recognize, wav_data)
 
     async def process_audio_chunk(self, chunk_buffer, chunk_index):
         """Process a single audio chunk."""
-        # Convert buffer to WAV file
-        wav_filename = f"recorded_audio_chunk_{chunk_index}.wav"
-        await self.write_audio_file(wav_filename, chunk_buffer)
-        _LOGGER.info(f"Chunk {chunk_index} recording complete. Sending to ACRCloud...")
+        _LOGGER.info("Chunk %d recording complete. Sending to ACRCloud...", chunk_index)
         
         try:
-            response = await self.recognize_audio(wav_filename)
-            _LOGGER.info(f"ACRCloud Response for chunk {chunk_index}: %s", response)
+            # The chunk is already a complete WAV file in memory; nothing is written to disk
+            response = await self.recognize_audio(chunk_buffer)
+            _LOGGER.info("ACRCloud Response for chunk %d: %s", chunk_index, response)
+            
+            # Only a match has a "music" list; no-match responses (the common case
+            # for the first chunks) are not worth parsing
+            if '"music"' not in response:
+                return None, False
             
-            # Parse JSON response
-            response_data = json.loads(response)
+            # Parse JSON response (orjson backed)
+            response_data = json_loads(response)
             
             # Check if we have a successful match
             if ("status" in response_data and 
@@ -246,23 +363,23 @@ class TaggingService:
             return response_data, False  # Return data but not successful
             
         except Exception as e:
-            _LOGGER.error(f"Error recognizing chunk {chunk_index}: %s", e)
+            _LOGGER.error("Error recognizing chunk %d: %s", chunk_index, e)
             return None, False
 
     async def handle_successful_match(self, response_data, include_lyrics, add_to_spotify):
         """Handle a successful match from ACRCloud."""
         first_match = response_data["metadata"]["music"][0]
         
-        artist_name = clean_text(first_match["artists"][0]["name"]) if "artists" in first_match else "Unknown Artist"
+        artists = first_match.get("artists")
+        artist_name = clean_text(artists[0]["name"]) if artists else "Unknown Artist"
         title = clean_text(first_match.get("title", "Unknown Title"))
         play_offset_ms = first_match.get("play_offset_ms", 0)
         play_time = format_time(play_offset_ms)
 
         # Extract Spotify-specific information
-        spotify_id = None
-        if "external_metadata" in first_match and "spotify" in first_match["external_metadata"]:
-            spotify_id = first_match["external_metadata"]["spotify"]["track"]["id"]
-            _LOGGER.warning(f"Extracted Spotify ID: {spotify_id}")
+        spotify_id = first_match.get("external_metadata", {}).get("spotify", {}).get("track", {}).get("id")
+        if spotify_id:
+            _LOGGER.warning("Extracted Spotify ID: %s", spotify_id)
 
         # Get device info
         device_config = get_device_config(self.hass, self.entry_id)
@@ -302,37 +419,43 @@ class TaggingService:
         if spotify_id:
             service_data['spotify_id'] = spotify_id
 
-        # Call add_to_spotify service if requested
-        if add_to_spotify:
-            _LOGGER.info(f"Adding to Spotify from device: {device_name}")
-            await self.hass.services.async_call(
-                DOMAIN,
-                'add_to_spotify', 
-                service_data
-            )
-
         # Formatted response for the main notification
         message = f"🎵 **Title**: {title}\n👤 **Artist**: {artist_name}\n⏱️ **Play Offset**: {play_time} (MM:SS)\n📱 **Device**: {device_name}"
 
-        await update_lyrics_input_text(self.hass, "", "", "")
-
         # Create a persistent notification with the formatted response
-        await self.hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": f"Audio Tagging Result - {device_name}",
-                "message": message,
-                "notification_id": f"tagging_result_{self.entry_id}" if self.entry_id else "tagging_result"
-            }
+        persistent_notification.async_create(
+            self.hass,
+            message,
+            title=f"Audio Tagging Result - {device_name}",
+            notification_id=f"tagging_result_{self.entry_id}" if self.entry_id else "tagging_result",
         )
 
+        # Clear the "Listening......" status from the default lyrics entities (no
+        # entry_id). It is awaited before the lookup starts: with a single device these
+        # can be the same entities the lookup writes its status to.
+        await update_lyrics_input_text(self.hass, "", "", "")
+
+        # The Spotify call and the lyrics lookup are independent, so run them together
+        post_match = []
+        
+        # Call add_to_spotify service if requested
+        if add_to_spotify:
+            _LOGGER.info("Adding to Spotify from device: %s", device_name)
+            post_match.append(self.hass.services.async_call(
+                DOMAIN,
+                'add_to_spotify', 
+                service_data
+            ))
+
         # Trigger lyrics lookup if enabled
-        if ENABLE_LYRICS_LOOKUP and include_lyrics:
-            if title and artist_name:
-                process_begin = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=FINETUNE_SYNC)
-                _LOGGER.info("Triggering lyrics lookup for: %s - %s (device: %s)", title, artist_name, device_name)
-                await trigger_lyrics_lookup(self.hass, title, artist_name, play_offset_ms, process_begin.isoformat(), self.entry_id)
+        if ENABLE_LYRICS_LOOKUP and include_lyrics and title and artist_name:
+            process_begin = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=FINETUNE_SYNC)
+            _LOGGER.info("Triggering lyrics lookup for: %s - %s (device: %s)", title, artist_name, device_name)
+            post_match.append(trigger_lyrics_lookup(self.hass, title, artist_name, play_offset_ms, process_begin.isoformat(), self.entry_id))
+
+        for result in await asyncio.gather(*post_match, return_exceptions=True):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error handling audio tagging match (device: %s): %s", device_name, result)
 
     async def handle_no_match(self):
         """Handle case when no music is recognized."""
@@ -357,69 +480,80 @@ class TaggingService:
             _LOGGER.info("Waiting for incoming UDP audio data...")
             await update_lyrics_input_text(self.hass, "Listening......", "", "")
             
+            # Bind the port before the switch starts the audio stream
+            await self.start_receiving()
+            
             # Turn on the tagging switch (only if it exists)
             if self.tagging_switch_entity_id:
                 # Check if the switch entity exists before using it
                 if not self.hass.states.get(self.tagging_switch_entity_id):
                     error_msg = f"Tagging switch entity '{self.tagging_switch_entity_id}' not found"
-                    _LOGGER.error(error_msg)
-                    await self.hass.services.async_call(
-                        "persistent_notification",
-                        "create",
-                        {
-                            "title": "Audio Tagging Error",
-                            "message": error_msg,
-                            "notification_id": "tagging_error"
-                        }
-                    )
+                    _LOGGER.error("%s", error_msg)
+                    create_error_notification(self.hass, error_msg)
                     return
                 
                 try:
-                    await self.hass.services.async_call(
-                        "switch", 
-                        "turn_on", 
-                        {"entity_id": self.tagging_switch_entity_id}
-                    )
-                    _LOGGER.info(f"Turned ON tagging switch: {self.tagging_switch_entity_id}")
+                    await self._switch_turn_on()
+                    _LOGGER.info("Turned ON tagging switch: %s", self.tagging_switch_entity_id)
                 except Exception as e:
-                    _LOGGER.error(f"Failed to turn on tagging switch: {e}")
+                    _LOGGER.error("Failed to turn on tagging switch: %s", e)
                     await update_lyrics_input_text(self.hass, "", "", "")
                     return
             
             total_chunks = max_duration // CHUNK_DURATION
-            all_audio_data = []
             success = False
             successful_response = None
             
-            for i in range(total_chunks):
-                _LOGGER.info(f"Recording chunk {i+1}/{total_chunks} ({CHUNK_DURATION} seconds)...")
-                
-                # Collect audio data for this chunk
-                chunk_buffer = await self.receive_udp_data(CHUNK_DURATION)
-                all_audio_data.extend(chunk_buffer)
-                
-                # Process this chunk
-                response_data, is_success = await self.process_audio_chunk(chunk_buffer, i+1)
+            # Each chunk is recognized in the background while the next one is
+            # recorded, so ACRCloud's round trip doesn't add to the listening time
+            chunk_tasks = {}
+            
+            def collect_results(done):
+                """Record the first successful result among finished chunk tasks."""
+                nonlocal success, successful_response
+                for task in done:
+                    chunk_index = chunk_tasks.pop(task)
+                    response_data, is_success = task.result()
+                    if is_success and not success:
+                        _LOGGER.info("Successfully recognized audio in chunk %d", chunk_index)
+                        success = True
+                        successful_response = response_data
+                    elif not is_success:
+                        _LOGGER.info("No match in chunk %d, continuing...", chunk_index)
+            
+            try:
+                for i in range(total_chunks):
+                    _LOGGER.info("Recording chunk %d/%d (%d seconds)...", i + 1, total_chunks, CHUNK_DURATION)
+                    
+                    # Collect audio data for this chunk
+                    chunk_buffer = await self.receive_udp_data(CHUNK_DURATION)
+                    
+                    # Process this chunk; the receive buffer is reused for the next
+                    # chunk while this one is recognized, so the task gets a copy of
+                    # the WAV file (the only copy between the socket and ACRCloud)
+                    task = asyncio.create_task(self.process_audio_chunk(bytes(chunk_buffer), i+1))
+                    chunk_tasks[task] = i + 1
+                    
+                    done, _ = await asyncio.wait(chunk_tasks, timeout=0)
+                    collect_results(done)
+                    if success:
+                        break
                 
-                if is_success:
-                    _LOGGER.info(f"Successfully recognized audio in chunk {i+1}")
-                    success = True
-                    successful_response = response_data
-                    break
-                else:
-                    _LOGGER.info(f"No match in chunk {i+1}, continuing...")
+                # Wait for the chunks still being recognized, stopping at the first match
+                while chunk_tasks and not success:
+                    done, _ = await asyncio.wait(chunk_tasks, return_when=asyncio.FIRST_COMPLETED)
+                    collect_results(done)
+            finally:
+                for task in chunk_tasks:
+                    task.cancel()
             
             # Turn off the tagging switch (only if it exists)
             if self.tagging_switch_entity_id:
                 try:
-                    await self.hass.services.async_call(
-                        "switch", 
-                        "turn_off", 
-                        {"entity_id": self.tagging_switch_entity_id}
-                    )
-                    _LOGGER.info(f"Turned OFF tagging switch: {self.tagging_switch_entity_id}")
+                    await self._switch_turn_off()
+                    _LOGGER.info("Turned OFF tagging switch: %s", self.tagging_switch_entity_id)
                 except Exception as e:
-                    _LOGGER.error(f"Failed to turn off tagging switch: {e}")
+                    _LOGGER.error("Failed to turn off tagging switch: %s", e)
             
             # Handle results
             if success:
@@ -429,14 +563,11 @@ class TaggingService:
                 await self.handle_no_match()
                 
                 # Create a notification for no match
-                await self.hass.services.async_call(
-                    "persistent_notification",
-                    "create",
-                    {
-                        "title": "Audio Tagging Result",
-                        "message": "No music recognized after trying all audio chunks.",
-                        "notification_id": "tagging_result"
-                    }
+                persistent_notification.async_create(
+                    self.hass,
+                    "No music recognized after trying all audio chunks.",
+                    title="Audio Tagging Result",
+                    notification_id="tagging_result",
                 )
                 
                 await update_lyrics_input_text(self.hass, "", "", "")
@@ -446,13 +577,9 @@ class TaggingService:
             # Ensure switch is turned off in case of an error (only if it exists)
             if self.tagging_switch_entity_id:
                 try:
-                    await self.hass.services.async_call(
-                        "switch", 
-                        "turn_off", 
-                        {"entity_id": self.tagging_switch_entity_id}
-                    )
+                    await self._switch_turn_off()
                 except Exception as switch_e:
-                    _LOGGER.error(f"Failed to turn off tagging switch during error handling: {switch_e}")
+                    _LOGGER.error("Failed to turn off tagging switch during error handling: %s", switch_e)
             
             # Fire error event
             self.hass.bus.async_fire("music_companion_tag_result", {
@@ -464,118 +591,121 @@ class TaggingService:
             })
             
             # Create a notification for the error
-            await self.hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": "Audio Tagging Error",
-                    "message": f"An error occurred: {str(e)}",
-                    "notification_id": "tagging_error"
-                }
-            )
+            create_error_notification(self.hass, f"An error occurred: {e}")
             
             await update_lyrics_input_text(self.hass, "", "", "")
+        
+        finally:
+            self.stop_receiving()
 
     def stop(self):
         """Stop the tagging service."""
         self.running = False
-        self.sock.close()
+        self._executor.shutdown(wait=False)
+        self.stop_receiving()
 
 
 async def handle_fetch_audio_tag(hass: HomeAssistant, call: ServiceCall):
     """Handle the service call for fetching audio tags - updated to handle optional tagging."""
-    try:
-        duration = call.data.get("duration", MAX_TOTAL_DURATION)
-        include_lyrics = call.data.get("include_lyrics", True)
-        add_to_spotify = call.data.get("add_to_spotify", True)
-        
-        # Support multiple ways to specify the tagging switch
-        tagging_switch_entity_id = call.data.get("tagging_switch_entity_id")
-        assist_satellite_entity = call.data.get("assist_satellite_entity")
+    duration = call.data.get("duration", MAX_TOTAL_DURATION)
+    include_lyrics = call.data.get("include_lyrics", True)
+    add_to_spotify = call.data.get("add_to_spotify", True)
+    
+    # Support multiple ways to specify the tagging switch
+    tagging_switch_entity_id = call.data.get("tagging_switch_entity_id")
+    assist_satellite_entity = call.data.get("assist_satellite_entity")
+    
+    entry_id = None
+    # Every way of resolving the device below ends in the same error notification
+    error_msg = None
+    
+    if tagging_switch_entity_id:
+        # Original method - direct switch specification (your automation uses this)
+        _LOGGER.info("Using directly specified tagging switch: %s", tagging_switch_entity_id)
         
-        entry_id = None
+        # Try to find matching device config for this switch
+        entry_id, device_config = find_device_config_by_switch(hass, tagging_switch_entity_id)
+        if device_config:
+            _LOGGER.info("Found matching device config: %s", device_config.get("device_name"))
         
-        if tagging_switch_entity_id:
-            # Original method - direct switch specification (your automation uses this)
-            _LOGGER.info("Using directly specified tagging switch: %s", tagging_switch_entity_id)
-            
-            # Try to find matching device config for this switch
-            entry_id, device_config = find_device_config_by_switch(hass, tagging_switch_entity_id)
-            if device_config:
-                _LOGGER.info("Found matching device config: %s", device_config.get("device_name"))
-            
-        elif assist_satellite_entity:
-            # Alternative method - find device by assist satellite
-            entry_id, device_config = find_device_config_by_assist_satellite(hass, assist_satellite_entity)
-            if device_config:
-                if device_config.get("tagging_enabled", False):
-                    tagging_switch_entity_id = device_config.get("tagging_switch_entity")
-                    _LOGGER.info("Found device config with tagging enabled: %s, switch: %s", 
-                               device_config.get("device_name"), tagging_switch_entity_id)
-                else:
-                    error_msg = f"Device '{device_config.get('device_name')}' does not support audio tagging (lyrics display only)"
-                    _LOGGER.error(error_msg)
-                    await create_error_notification(hass, error_msg)
-                    return
-            else:
-                error_msg = f"No Music Companion device found for assist satellite: {assist_satellite_entity}"
-                _LOGGER.error(error_msg)
-                await create_error_notification(hass, error_msg)
-                return
-            
+    elif assist_satellite_entity:
+        # Alternative method - find device by assist satellite
+        entry_id, device_config = find_device_config_by_assist_satellite(hass, assist_satellite_entity)
+        if not device_config:
+            error_msg = f"No Music Companion device found for assist satellite: {assist_satellite_entity}"
+        elif not device_config.get("tagging_enabled", False):
+            error_msg = f"Device '{device_config.get('device_name')}' does not support audio tagging (lyrics display only)"
         else:
-            # Auto-detect: use first available device config with tagging enabled
-            device_configs = get_device_configs(hass)
-            tagging_enabled_devices = [(eid, config) for eid, config in device_configs if config.get("tagging_enabled", False)]
-            
-            if tagging_enabled_devices:
-                entry_id = tagging_enabled_devices[0][0]
-                device_config = tagging_enabled_devices[0][1]
-                tagging_switch_entity_id = device_config.get("tagging_switch_entity")
-                auto_device_name = device_config.get("device_name", "Unknown Device")
-                _LOGGER.info("Auto-selected device with tagging: %s, switch: %s", auto_device_name, tagging_switch_entity_id)
-            else:
-                error_msg = "No tagging switch specified and no devices with tagging capability found."
-                _LOGGER.error(error_msg)
-                await create_error_notification(hass, error_msg)
-                return
-        
-        # Final validation - ensure we have a tagging switch for devices that support tagging
-        if not tagging_switch_entity_id:
-            error_msg = "No tagging switch found for audio tagging operation"
-            _LOGGER.error(error_msg)
-            await create_error_notification(hass, error_msg)
-            return
-
-        _LOGGER.info("Audio tagging service called - Duration: %s, Switch: %s, Entry: %s", 
-                    duration, tagging_switch_entity_id, entry_id)
-        
-        # Create and run tagging service
-        tagging_service = TaggingService(hass, tagging_switch_entity_id, entry_id)
-        service_key = f"tagging_service_{entry_id or 'default'}"
+            tagging_switch_entity_id = device_config.get("tagging_switch_entity")
+            _LOGGER.info("Found device config with tagging enabled: %s, switch: %s", 
+                       device_config.get("device_name"), tagging_switch_entity_id)
         
-        # Stop any existing service
-        if service_key in hass.data:
-            hass.data[service_key].stop()
-        
-        hass.data[service_key] = tagging_service
-        await tagging_service.listen_for_audio(duration, include_lyrics, add_to_spotify)
+    else:
+        # Auto-detect: use first available device config with tagging enabled
+        first_tagging_device = next(
+            ((eid, config) for eid, config in get_device_configs(hass) if config.get("tagging_enabled", False)),
+            None,
+        )
         
-    except Exception as e:
-        error_msg = f"Error in audio tagging service: {str(e)}"
-        _LOGGER.error(error_msg)
-        await create_error_notification(hass, error_msg)
+        if first_tagging_device:
+            entry_id, device_config = first_tagging_device
+            tagging_switch_entity_id = device_config.get("tagging_switch_entity")
+            auto_device_name = device_config.get("device_name", "Unknown Device")
+            _LOGGER.info("Auto-selected device with tagging: %s, switch: %s", auto_device_name, tagging_switch_entity_id)
+        else:
+            error_msg = "No tagging switch specified and no devices with tagging capability found."
+    
+    # Final validation - ensure we have a tagging switch for devices that support tagging
+    if not error_msg and not tagging_switch_entity_id:
+        error_msg = "No tagging switch found for audio tagging operation"
+    
+    if error_msg:
+        _LOGGER.error("%s", error_msg)
+        create_error_notification(hass, error_msg)
+        return
 
-async def create_error_notification(hass, message):
+    _LOGGER.info("Audio tagging service called - Duration: %s, Switch: %s, Entry: %s", 
+                duration, tagging_switch_entity_id, entry_id)
+    
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    service_key = entry_id or "default"
+    
+    # All devices receive audio on the master configuration's UDP port, so only one
+    # run per port at a time; a second request while one is listening is turned
+    # away instead of tearing down the running one
+    conf = get_tagging_config(hass, entry_id)
+    port = conf.get("port") if conf else None
+    lock = domain_data.setdefault("_tagging_locks", {}).setdefault(port, asyncio.Lock())
+    if lock.locked():
+        error_msg = "Audio tagging is already running. Try again in a moment."
+        _LOGGER.warning("%s", error_msg)
+        create_error_notification(hass, error_msg)
+        return
+    
+    async with lock:
+        try:
+            # Reuse the device's tagging service (recognizers and executor) unless it
+            # was stopped or a different switch was requested
+            tagging_services = domain_data.setdefault("_tagging_services", {})
+            tagging_service = tagging_services.get(service_key)
+            if (tagging_service is None or not tagging_service.running
+                    or tagging_service.tagging_switch_entity_id != tagging_switch_entity_id):
+                if tagging_service is not None:
+                    tagging_service.stop()
+                tagging_service = TaggingService(hass, tagging_switch_entity_id, entry_id)
+                tagging_services[service_key] = tagging_service
+            
+            await tagging_service.listen_for_audio(duration, include_lyrics, add_to_spotify)
+            
+        except Exception as e:
+            _LOGGER.error("Error in audio tagging service: %s", e)
+            create_error_notification(hass, f"Error in audio tagging service: {e}")
+
+@callback
+def create_error_notification(hass, message):
     """Create an error notification."""
-    await hass.services.async_call(
-        "persistent_notification",
-        "create",
-        {
-            "title": "Audio Tagging Error",
-            "message": message,
-            "notification_id": "tagging_error"
-        }
+    persistent_notification.async_create(
+        hass, message, title="Audio Tagging Error", notification_id="tagging_error"
     )
 
 
@@ -583,13 +713,10 @@ async def async_setup_tagging_service(hass: HomeAssistant):
     """Register the fetch_audio_tag service in Home Assistant."""
     _LOGGER.info("Registering the fetch_audio_tag service.")
 
-    async def async_wrapper(call):
-        await handle_fetch_audio_tag(hass, call)
-
     hass.services.async_register(
         DOMAIN,
         "fetch_audio_tag",
-        async_wrapper,
+        partial(handle_fetch_audio_tag, hass),
         schema=SERVICE_FETCH_AUDIO_TAG_SCHEMA
     )
 